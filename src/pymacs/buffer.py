@@ -0,0 +1,154 @@
+"""Gap buffer text storage for editor buffers."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+
+# Inserts are appended onto the last chunk before the gap while it is shorter than
+# this, so a stream of single-character inserts does not grow one chunk per key.
+_APPEND_CHUNK_SIZE = 512
+
+
+class GapBuffer:
+    """Buffer text with a movable gap so edits at point avoid whole-buffer copies.
+
+    Text before the gap is kept as a list of chunks (inserts append to it) and
+    text after the gap as a string plus start offset (forward deletes advance the
+    offset). The joined text is materialized lazily and cached until the next edit,
+    as is the sorted list of newline offsets used for line navigation.
+    """
+
+    __slots__ = ("_before", "_before_len", "_after", "_after_start", "_text", "_newlines")
+
+    def __init__(self, text: str = "") -> None:
+        self._before: list[str] = []
+        self._before_len = 0
+        self._after = ""
+        self._after_start = 0
+        self._text: str | None = None
+        self._newlines: list[int] | None = None
+        self.replace(text)
+
+    def __len__(self) -> int:
+        return self._before_len + len(self._after) - self._after_start
+
+    def __repr__(self) -> str:
+        return f"GapBuffer({self.text()!r})"
+
+    def __str__(self) -> str:
+        return self.text()
+
+    def text(self) -> str:
+        """Return buffer contents, joining pending chunks at most once per edit."""
+        text = self._text
+        if text is None:
+            before = "".join(self._before)
+            self._before = [before] if before else []
+            text = before + self._after[self._after_start :]
+            self._text = text
+        return text
+
+    def newlines(self) -> list[int]:
+        """Return the sorted offsets of every newline in the buffer."""
+        newlines = self._newlines
+        if newlines is None:
+            newlines = _scan_newlines(self.text())
+            self._newlines = newlines
+        return newlines
+
+    def line_start(self, pos: int) -> int:
+        """Return the offset of the first character on the line containing POS."""
+        newlines = self.newlines()
+        index = bisect_left(newlines, pos)
+        return newlines[index - 1] + 1 if index else 0
+
+    def line_end(self, pos: int) -> int:
+        """Return the offset of the newline ending the line at POS, or buffer end."""
+        newlines = self.newlines()
+        index = bisect_left(newlines, pos)
+        return newlines[index] if index < len(newlines) else len(self)
+
+    def replace(self, text: str) -> None:
+        """Replace the whole buffer contents with TEXT, placing the gap at the end."""
+        self._before = [text] if text else []
+        self._before_len = len(text)
+        self._after = ""
+        self._after_start = 0
+        self._text = text
+        self._newlines = None
+
+    def insert(self, pos: int, text: str) -> None:
+        """Insert TEXT at character offset POS."""
+        if not text:
+            return
+        length = len(self)
+        pos = 0 if pos < 0 else length if pos > length else pos
+        self._move_gap(pos)
+        before = self._before
+        if before and len(before[-1]) < _APPEND_CHUNK_SIZE:
+            before[-1] += text
+        else:
+            before.append(text)
+        self._before_len += len(text)
+        self._text = None
+
+        newlines = self._newlines
+        if newlines is not None:
+            index = bisect_left(newlines, pos)
+            added = [pos + offset for offset in _scan_newlines(text)]
+            if index < len(newlines):
+                shift = len(text)
+                added.extend(offset + shift for offset in newlines[index:])
+            newlines[index:] = added
+
+    def delete(self, start: int, end: int) -> None:
+        """Delete characters in the half-open range [START, END)."""
+        start = max(0, start)
+        end = min(len(self), end)
+        if end <= start:
+            return
+
+        if end == self._before_len:
+            self._trim_before(end - start)
+        else:
+            self._move_gap(start)
+            self._after_start += end - start
+        self._text = None
+
+        newlines = self._newlines
+        if newlines is not None:
+            low = bisect_left(newlines, start)
+            high = bisect_left(newlines, end)
+            if low < len(newlines):
+                count = end - start
+                newlines[low:] = [offset - count for offset in newlines[high:]]
+
+    def _move_gap(self, pos: int) -> None:
+        if pos == self._before_len:
+            return
+        text = self.text()
+        self._before = [text[:pos]] if pos else []
+        self._before_len = pos
+        self._after = text
+        self._after_start = pos
+
+    def _trim_before(self, count: int) -> None:
+        before = self._before
+        self._before_len -= count
+        while count:
+            chunk = before.pop()
+            if len(chunk) > count:
+                before.append(chunk[:-count])
+                return
+            count -= len(chunk)
+
+
+def _scan_newlines(text: str) -> list[int]:
+    # str.find runs a memchr-style scan in C; only newline hits reach Python code.
+    newlines: list[int] = []
+    find = text.find
+    index = find("\n")
+    while index != -1:
+        newlines.append(index)
+        index = find("\n", index + 1)
+    return newlines
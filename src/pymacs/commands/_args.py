@@ -0,0 +1,10 @@
+"""Argument helpers shared by built-in commands."""
+
+from __future__ import annotations
+
+
+def join_parts(parts: tuple[object, ...]) -> str:
+    """Join variadic command arguments into one space-separated string."""
+    if len(parts) == 1 and type(parts[0]) is str:
+        return parts[0]
+    return " ".join(map(str, parts))
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from ..core import Editor, KeyBindingInfo
 from ..keymap import format_key_sequence
+from ._args import join_parts
 
 HELP_BUFFER_NAME = "*Help*"
 
@@ -29,7 +30,7 @@ def register_help_commands(editor: Editor) -> None:
 
     def describe_key(ed: Editor, *parts: object) -> str:
         """Describe command bound to key sequence."""
-        sequence = _parts_to_arg(parts)
+        sequence = join_parts(parts).strip()
         if not sequence:
             raise ValueError("usage: describe-key <key-sequence>")
 
@@ -64,13 +65,14 @@ def register_help_commands(editor: Editor) -> None:
         _show_help(ed, "\n".join(lines))
         return f"help: {command_name}"
 
-    editor.command("describe-command", describe_command, source_kind="builtin")
-    editor.command("describe-key", describe_key, source_kind="builtin")
-    editor.command("where-is", where_is, source_kind="builtin")
-
-
-def _parts_to_arg(parts: tuple[object, ...]) -> str:
-    return " ".join(str(part) for part in parts).strip()
+    editor.register_commands(
+        {
+            "describe-command": describe_command,
+            "describe-key": describe_key,
+            "where-is": where_is,
+        },
+        source_kind="builtin",
+    )
 
 
 def _format_scope(binding: KeyBindingInfo) -> str:
@@ -82,6 +84,6 @@ def _format_scope(binding: KeyBindingInfo) -> str:
 
 
 def _show_help(editor: Editor, text: str) -> None:
-    editor.state.buffers[HELP_BUFFER_NAME] = text
+    editor.state.set_buffer_text(HELP_BUFFER_NAME, text)
     editor.state.mark_buffer_recent(HELP_BUFFER_NAME)
     editor.pop_to_buffer(HELP_BUFFER_NAME, prefer_other=True)
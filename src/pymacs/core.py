@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import inspect
 import logging
-from collections import defaultdict
-from collections.abc import Callable
+import sys
+import weakref
+from bisect import insort
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from importlib.util import module_from_spec, spec_from_file_location
 from pathlib import Path
+from types import CodeType
 
 from .keymap import KeySequence, KeySequenceInput, format_key_sequence, parse_key_sequence
 from .state import EditorState
@@ -19,6 +22,13 @@ logger = logging.getLogger(__name__)
 
 _SOURCE_KINDS = {"builtin", "plugin", "runtime"}
 
+# Builtin commands are closures re-created for every Editor but share code objects,
+# so their rendered signatures are computed once per code object. Annotations are
+# stored alongside, since they belong to the function object rather than the code.
+_SIGNATURES_BY_CODE: weakref.WeakKeyDictionary[CodeType, tuple[str, dict[str, object]]] = (
+    weakref.WeakKeyDictionary()
+)
+
 
 @dataclass(frozen=True)
 class CommandInfo:
@@ -43,25 +53,37 @@ class KeyBindingInfo:
     mode: str | None = None
 
 
+# Merged bindings for one buffer, plus every proper prefix of a bound sequence.
+ResolvedKeymap = tuple[dict[KeySequence, KeyBindingInfo], frozenset[KeySequence]]
+
+
 class Editor:
     """Live editor runtime with command/hook/plugin APIs."""
 
     def __init__(self) -> None:
         self.state = EditorState()
         self._commands: dict[str, CommandInfo] = {}
-        self._hooks: dict[str, list[Hook]] = defaultdict(list)
+        self._sorted_command_names: list[str] = []
+        self._command_infos: tuple[CommandInfo, ...] | None = None
+        self._command_names_line: str | None = None
+        # Hook tuples are replaced on registration so emitting never copies or allocates.
+        self._hooks: dict[str, tuple[Hook, ...]] = {}
         self._plugins: dict[str, object] = {}
         self._registration_source_kind = "runtime"
+        self._resolved_keymaps: dict[str, ResolvedKeymap] = {}
+        self._resolved_keymaps_revision = self.state.keymap_revision
 
     def command(self, name: str, fn: Command, *, source_kind: str | None = None) -> None:
+        name = sys.intern(name)
         kind = self._normalize_source_kind(source_kind or self._registration_source_kind)
         doc = inspect.getdoc(fn) or "(undocumented command)"
         module_name = str(getattr(fn, "__module__", ""))
-        try:
-            signature = str(inspect.signature(fn))
-        except (TypeError, ValueError):
-            signature = "(...)"
+        signature = _command_signature(fn)
 
+        if name not in self._commands:
+            insort(self._sorted_command_names, name)
+            self._command_names_line = None
+        self._command_infos = None
         self._commands[name] = CommandInfo(
             name=name,
             fn=fn,
@@ -71,6 +93,15 @@ class Editor:
             source_kind=kind,
         )
 
+    def register_commands(
+        self,
+        commands: Mapping[str, Command],
+        *,
+        source_kind: str | None = None,
+    ) -> None:
+        for name, fn in commands.items():
+            self.command(name, fn, source_kind=source_kind)
+
     def get_command_info(self, name: str) -> CommandInfo:
         command = self._commands.get(name)
         if command is None:
@@ -78,26 +109,34 @@ class Editor:
         return command
 
     def command_infos(self) -> list[CommandInfo]:
-        return [self._commands[name] for name in self.commands]
+        infos = self._command_infos
+        if infos is None:
+            infos = tuple(self._commands[name] for name in self._sorted_command_names)
+            self._command_infos = infos
+        return list(infos)
 
     def run(self, name: str, *args: object) -> object:
         info = self._commands.get(name)
         if info is None:
             raise KeyError(f"unknown command: {name}")
-        self.emit("before-command", name, args)
+        hooks = self._hooks
+        if not hooks:
+            return info.fn(self, *args)
+        before = hooks.get("before-command")
+        if before:
+            self._call_hooks("before-command", before, (name, args))
         result = info.fn(self, *args)
-        self.emit("after-command", name, args, result)
+        after = hooks.get("after-command")
+        if after:
+            self._call_hooks("after-command", after, (name, args, result))
         return result
 
     def on(self, event: str, fn: Hook) -> None:
-        self._hooks[event].append(fn)
+        event = sys.intern(event)
+        self._hooks[event] = (*self._hooks.get(event, ()), fn)
 
     def emit(self, event: str, *args: object) -> None:
-        for fn in self._hooks.get(event, []):
-            try:
-                fn(self, *args)
-            except Exception:
-                logger.exception("hook failed for event %s", event)
+        self._call_hooks(event, self._hooks.get(event), args)
 
     def load_plugin(self, plugin_path: str) -> None:
         path = Path(plugin_path).expanduser().resolve()
@@ -134,26 +173,23 @@ class Editor:
 
         if scope == "global":
             self.state.global_keymap[key] = command_name
-            return
-
-        if scope == "buffer":
+        elif scope == "buffer":
             target = buffer or self.state.selected_buffer()
             self.state.buffer_keymaps.setdefault(target, {})[key] = command_name
-            return
-
-        if scope == "mode":
+        elif scope == "mode":
             if not mode:
                 raise ValueError("mode name required for mode scope")
             self.state.mode_keymaps.setdefault(mode, {})[key] = command_name
-            return
-
-        raise ValueError(f"unknown keymap scope: {scope}")
+        else:
+            raise ValueError(f"unknown keymap scope: {scope}")
+        self.state.bump_keymap_revision()
 
     def enable_mode(self, mode: str, *, buffer: str | None = None) -> None:
         target = buffer or self.state.selected_buffer()
         modes = self.state.buffer_modes.setdefault(target, [])
         if mode not in modes:
             modes.append(mode)
+            self.state.bump_keymap_revision()
 
     def disable_mode(self, mode: str, *, buffer: str | None = None) -> None:
         target = buffer or self.state.selected_buffer()
@@ -162,25 +198,26 @@ class Editor:
             return
         if mode in modes:
             modes.remove(mode)
+            self.state.bump_keymap_revision()
 
     def resolve_key(self, sequence: KeySequenceInput, *, buffer: str | None = None) -> str:
         return self.describe_key(sequence, buffer=buffer).command_name
 
+    def lookup_key(self, sequence: KeySequenceInput, *, buffer: str | None = None) -> str | None:
+        """Return the command bound to SEQUENCE, or None when it is unbound."""
+        key = parse_key_sequence(sequence)
+        bindings, _prefixes = self._resolved_keymap(buffer or self.state.selected_buffer())
+        binding = bindings.get(key)
+        return binding.command_name if binding is not None else None
+
     def describe_key(self, sequence: KeySequenceInput, *, buffer: str | None = None) -> KeyBindingInfo:
         key = parse_key_sequence(sequence)
         target = buffer or self.state.selected_buffer()
 
-        for scope, mode_name, target_buffer, keymap in self._active_keymaps(target):
-            command_name = keymap.get(key)
-            if command_name is None:
-                continue
-            return KeyBindingInfo(
-                sequence=key,
-                command_name=command_name,
-                scope=scope,
-                buffer=target_buffer,
-                mode=mode_name,
-            )
+        bindings, _prefixes = self._resolved_keymap(target)
+        binding = bindings.get(key)
+        if binding is not None:
+            return binding
 
         raise KeyError(f"unbound key sequence: {format_key_sequence(key)}")
 
@@ -210,14 +247,8 @@ class Editor:
     def has_prefix_binding(self, sequence: KeySequenceInput, *, buffer: str | None = None) -> bool:
         key = parse_key_sequence(sequence)
         target = buffer or self.state.selected_buffer()
-
-        for _scope, _mode_name, _target_buffer, keymap in self._active_keymaps(target):
-            for bound_sequence in keymap:
-                if len(bound_sequence) <= len(key):
-                    continue
-                if bound_sequence[: len(key)] == key:
-                    return True
-        return False
+        _bindings, prefixes = self._resolved_keymap(target)
+        return key in prefixes
 
     def command_execute(
         self,
@@ -230,7 +261,14 @@ class Editor:
 
     @property
     def commands(self) -> list[str]:
-        return sorted(self._commands)
+        return list(self._sorted_command_names)
+
+    def command_names_line(self) -> str:
+        """Return all command names, sorted and space-separated."""
+        line = self._command_names_line
+        if line is None:
+            line = self._command_names_line = " ".join(self._sorted_command_names)
+        return line
 
     @property
     def selected_window_id(self) -> int:
@@ -276,7 +314,74 @@ class Editor:
         active.append(("global", None, None, self.state.global_keymap))
         return active
 
+    def _call_hooks(self, event: str, hooks: tuple[Hook, ...] | None, args: tuple[object, ...]) -> None:
+        if not hooks:
+            return
+        for fn in hooks:
+            try:
+                fn(self, *args)
+            except Exception:
+                logger.exception("hook failed for event %s", event)
+
+    def _resolved_keymap(self, buffer: str) -> ResolvedKeymap:
+        """Return BUFFER's active keymaps merged by precedence, plus all bound prefixes."""
+        revision = self.state.keymap_revision
+        if revision != self._resolved_keymaps_revision:
+            self._resolved_keymaps.clear()
+            self._resolved_keymaps_revision = revision
+
+        resolved = self._resolved_keymaps.get(buffer)
+        if resolved is not None:
+            return resolved
+
+        bindings: dict[KeySequence, KeyBindingInfo] = {}
+        prefixes: set[KeySequence] = set()
+        for scope, mode_name, target_buffer, keymap in reversed(self._active_keymaps(buffer)):
+            for sequence, command_name in keymap.items():
+                bindings[sequence] = KeyBindingInfo(
+                    sequence=sequence,
+                    command_name=command_name,
+                    scope=scope,
+                    buffer=target_buffer,
+                    mode=mode_name,
+                )
+                prefixes.update(sequence[:size] for size in range(1, len(sequence)))
+
+        resolved = (bindings, frozenset(prefixes))
+        self._resolved_keymaps[buffer] = resolved
+        return resolved
+
     def _normalize_source_kind(self, source_kind: str) -> str:
         if source_kind in _SOURCE_KINDS:
-            return source_kind
+            return sys.intern(source_kind)
         return "runtime"
+
+
+def _command_signature(fn: Command) -> str:
+    code = getattr(fn, "__code__", None)
+    # Defaults, __wrapped__ (which inspect.signature follows) and __signature__ belong
+    # to the function object, so only functions without them share by code.
+    shareable = (
+        isinstance(code, CodeType)
+        and not getattr(fn, "__defaults__", None)
+        and not getattr(fn, "__kwdefaults__", None)
+        and not hasattr(fn, "__wrapped__")
+        and not hasattr(fn, "__signature__")
+    )
+    if not shareable:
+        return _inspect_signature(fn)
+
+    annotations = getattr(fn, "__annotations__", None) or {}
+    cached = _SIGNATURES_BY_CODE.get(code)
+    if cached is not None and cached[1] == annotations:
+        return cached[0]
+    signature = _inspect_signature(fn)
+    _SIGNATURES_BY_CODE[code] = (signature, dict(annotations))
+    return signature
+
+
+def _inspect_signature(fn: Command) -> str:
+    try:
+        return str(inspect.signature(fn))
+    except (TypeError, ValueError):
+        return "(...)"
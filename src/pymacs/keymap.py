@@ -3,8 +3,16 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from functools import lru_cache
 
 MODIFIER_ORDER = ("C", "M", "S")
+# Modifiers are folded into a bitmask while parsing; the prefix for every mask is
+# precomputed in canonical MODIFIER_ORDER.
+_MODIFIER_BITS = {mod: 1 << index for index, mod in enumerate(MODIFIER_ORDER)}
+_BITS_TO_PREFIX = tuple(
+    "".join(f"{mod}-" for mod in MODIFIER_ORDER if mask & _MODIFIER_BITS[mod])
+    for mask in range(1 << len(MODIFIER_ORDER))
+)
 MODIFIER_ALIASES = {
     "C": "C",
     "CTRL": "C",
@@ -22,47 +30,49 @@ KeySequenceInput = str | Sequence[str]
 
 def parse_key_sequence(sequence: KeySequenceInput) -> KeySequence:
     """Parse user input into canonical key-sequence tuples."""
-    tokens: list[str]
+    if isinstance(sequence, (str, tuple)):
+        return _parse_hashable_sequence(sequence)
+    return _parse_tokens([str(tok).strip() for tok in sequence])
+
+
+def format_key_sequence(sequence: KeySequence) -> str:
+    """Render a canonical key sequence for messages."""
+    return " ".join(sequence)
+
+
+@lru_cache(maxsize=1024)
+def _parse_hashable_sequence(sequence: str | tuple[str, ...]) -> KeySequence:
+    # Resolvers are called per keystroke with a small set of strings and
+    # already-canonical tuples, so parse results are memoized.
     if isinstance(sequence, str):
-        tokens = sequence.split()
-    else:
-        tokens = [str(tok).strip() for tok in sequence]
+        return _parse_tokens(sequence.split())
+    return _parse_tokens([str(tok).strip() for tok in sequence])
+
 
+def _parse_tokens(tokens: list[str]) -> KeySequence:
     if not tokens:
         raise ValueError("empty key sequence")
 
     return tuple(_parse_chord(token) for token in tokens)
 
 
-def format_key_sequence(sequence: KeySequence) -> str:
-    """Render a canonical key sequence for messages."""
-    return " ".join(sequence)
-
-
+@lru_cache(maxsize=1024)
 def _parse_chord(token: str) -> str:
     token = token.strip()
     if not token:
         raise ValueError("empty key token")
+    if "-" not in token:
+        return token.lower()
 
     parts = token.split("-")
     if any(part == "" for part in parts):
         raise ValueError(f"invalid key token: {token}")
 
-    base = parts[-1]
-    if not base:
-        raise ValueError(f"missing key in token: {token}")
-
-    modifiers: list[str] = []
+    mask = 0
     for raw_mod in parts[:-1]:
         mod = MODIFIER_ALIASES.get(raw_mod.upper())
         if mod is None:
             raise ValueError(f"unknown key modifier: {raw_mod}")
-        if mod not in modifiers:
-            modifiers.append(mod)
-
-    ordered = [mod for mod in MODIFIER_ORDER if mod in modifiers]
-    key = base.lower()
+        mask |= _MODIFIER_BITS[mod]
 
-    if ordered:
-        return "-".join([*ordered, key])
-    return key
+    return _BITS_TO_PREFIX[mask] + parts[-1].lower()
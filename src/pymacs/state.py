@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import sys
+from bisect import bisect_left, insort
+from collections import OrderedDict
 from dataclasses import dataclass, field
 
+from .buffer import GapBuffer
 from .keymap import KeySequence
 
 LayoutRef = tuple[str, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class Window:
     """Leaf window in the layout tree."""
 
@@ -17,7 +21,7 @@ class Window:
     buffer: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SplitNode:
     """Binary split node in the layout tree."""
 
@@ -31,12 +35,16 @@ class SplitNode:
 class EditorState:
     """Runtime mutable editor state."""
 
-    buffers: dict[str, str] = field(default_factory=lambda: {"*scratch*": ""})
+    buffers: dict[str, GapBuffer] = field(default_factory=lambda: {"*scratch*": GapBuffer()})
     variables: dict[str, object] = field(default_factory=dict)
+    # Key resolution is cached per keymap_revision. Editor.bind_key, enable_mode and
+    # disable_mode bump it; code that writes these four dicts directly must call
+    # bump_keymap_revision() afterwards or lookups keep the old bindings.
     global_keymap: dict[KeySequence, str] = field(default_factory=dict)
     buffer_keymaps: dict[str, dict[KeySequence, str]] = field(default_factory=dict)
     mode_keymaps: dict[str, dict[KeySequence, str]] = field(default_factory=dict)
     buffer_modes: dict[str, list[str]] = field(default_factory=dict)
+    keymap_revision: int = 0
 
     windows: dict[int, Window] = field(default_factory=lambda: {1: Window(id=1, buffer="*scratch*")})
     splits: dict[int, SplitNode] = field(default_factory=dict)
@@ -46,8 +54,33 @@ class EditorState:
     next_window_id: int = 2
     next_split_id: int = 1
 
-    window_points: dict[int, dict[str, int]] = field(default_factory=lambda: {1: {"*scratch*": 0}})
-    buffer_history: list[str] = field(default_factory=lambda: ["*scratch*"])
+    # Point per (window id, buffer name), so each window remembers point per buffer.
+    window_points: dict[tuple[int, str], int] = field(default_factory=lambda: {(1, "*scratch*"): 0})
+    # Most recently used buffer first; values are unused.
+    buffer_history: OrderedDict[str, None] = field(
+        default_factory=lambda: OrderedDict.fromkeys(["*scratch*"])
+    )
+
+    # Flattened layout order and child -> (parent split, side) index, built lazily
+    # and then maintained by split/delete so window commands avoid tree walks.
+    _window_order: list[int] | None = field(default=None, init=False, repr=False, compare=False)
+    _parent_of: dict[LayoutRef, tuple[int, str]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Nested-tuple layout returned by layout_tree(), dropped whenever the tree changes.
+    _layout_tree: tuple[object, ...] | None = field(default=None, init=False, repr=False, compare=False)
+    _sorted_buffer_names: list[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    # Buffer name -> ids of windows remembering a point in it, built from the keys of
+    # window_points and rebuilt when that dict is replaced or its size changes.
+    _point_windows: dict[str, set[int]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _point_windows_source: tuple[dict[tuple[int, str], int], int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._sorted_buffer_names = sorted(self.buffers)
 
     def selected_buffer(self) -> str:
         window = self.windows[self.selected_window_id]
@@ -55,37 +88,86 @@ class EditorState:
         self._ensure_window_point(window.id, window.buffer)
         return window.buffer
 
+    def bump_keymap_revision(self) -> None:
+        """Expire cached key resolution after keymaps or buffer modes change."""
+        self.keymap_revision += 1
+
+    def buffer_names(self) -> list[str]:
+        """Return buffer names in sorted order."""
+        if len(self._sorted_buffer_names) != len(self.buffers):
+            # `buffers` is public; resync after buffers added or removed directly.
+            self._sorted_buffer_names = sorted(self.buffers)
+        return list(self._sorted_buffer_names)
+
+    def buffer(self, buffer_name: str) -> GapBuffer:
+        buffer = self.buffers[buffer_name]
+        if isinstance(buffer, str):
+            # `buffers` held plain strings before the gap buffer; accept them.
+            buffer = self.buffers[buffer_name] = GapBuffer(buffer)
+        return buffer
+
     def set_selected_buffer(self, buffer_name: str) -> None:
         self.set_window_buffer(self.selected_window_id, buffer_name)
 
     def current_text(self) -> str:
-        buffer_name = self.selected_buffer()
-        return self.buffers.setdefault(buffer_name, "")
+        return self.buffer(self.selected_buffer()).text()
 
     def set_current_text(self, text: str) -> None:
+        self.set_buffer_text(self.selected_buffer(), text)
+
+    def insert_text(self, text: str) -> None:
+        """Insert TEXT at point in the selected window and move point after it."""
+        buffer, cursor = self.current_buffer_and_cursor()
+        buffer.insert(cursor, text)
+        self.set_current_cursor(cursor + len(text))
+
+    def delete_text(self, start: int, end: int) -> None:
+        """Delete text between START and END in the selected buffer."""
         buffer_name = self.selected_buffer()
-        self.buffers[buffer_name] = text
-        text_len = len(text)
+        self.buffer(buffer_name).delete(start, end)
+        self._clamp_buffer_points(buffer_name)
 
-        for points in self.window_points.values():
-            if buffer_name not in points:
-                continue
-            points[buffer_name] = max(0, min(points[buffer_name], text_len))
+    def buffer_text(self, buffer_name: str) -> str:
+        self.ensure_buffer(buffer_name)
+        return self.buffer(buffer_name).text()
+
+    def set_buffer_text(self, buffer_name: str, text: str) -> None:
+        self.ensure_buffer(buffer_name)
+        self.buffer(buffer_name).replace(text)
+        self._clamp_buffer_points(buffer_name)
 
     def current_cursor(self) -> int:
         return self.window_cursor(self.selected_window_id)
 
+    def current_buffer_and_cursor(self) -> tuple[GapBuffer, int]:
+        """Return the selected buffer storage and point, resolving the buffer once."""
+        buffer_name = self.selected_buffer()
+        return self.buffer(buffer_name), self._window_point(self.selected_window_id, buffer_name)
+
     def set_current_cursor(self, cursor: int) -> None:
         self.set_window_cursor(self.selected_window_id, cursor)
 
-    def current_modes(self) -> list[str]:
-        return list(self.buffer_modes.get(self.selected_buffer(), []))
+    def move_cursor(self, delta: int) -> None:
+        """Move point in the selected window by DELTA, clamped to the buffer."""
+        buffer_name = self.selected_buffer()
+        key = (self.selected_window_id, buffer_name)
+        cursor = self.window_points.get(key, 0) + delta
+        text_len = len(self.buffer(buffer_name))
+        self.window_points[key] = 0 if cursor < 0 else text_len if cursor > text_len else cursor
+
+    def current_modes(self) -> tuple[str, ...]:
+        return tuple(self.buffer_modes.get(self.selected_buffer(), ()))
 
     def window_list(self) -> list[int]:
-        return self._walk_windows(self.layout_root)
+        return list(self._ordered_windows())
 
     def layout_tree(self) -> tuple[object, ...]:
-        return self._build_layout_tree(self.layout_root)
+        """Return the layout as nested tuples; the same object until the layout changes."""
+        tree = self._layout_tree
+        if tree is None:
+            tree = self._build_layout_tree(self.layout_root)
+            self._layout_tree = tree
+        return tree
 
     def window_buffer(self, window_id: int) -> str:
         window = self.windows[window_id]
@@ -93,8 +175,10 @@ class EditorState:
         return window.buffer
 
     def set_window_buffer(self, window_id: int, buffer_name: str) -> None:
+        buffer_name = sys.intern(buffer_name)
         self.ensure_buffer(buffer_name)
-        self.windows[window_id].buffer = buffer_name
+        window = self.windows[window_id]
+        window.buffer = buffer_name
         self._ensure_window_point(window_id, buffer_name)
         self.mark_buffer_recent(buffer_name)
 
@@ -104,8 +188,10 @@ class EditorState:
 
     def set_window_cursor(self, window_id: int, cursor: int) -> None:
         buffer_name = self.window_buffer(window_id)
-        text_len = len(self.buffers[buffer_name])
-        self.window_points.setdefault(window_id, {})[buffer_name] = max(0, min(cursor, text_len))
+        text_len = len(self.buffer(buffer_name))
+        self.window_points[window_id, buffer_name] = (
+            0 if cursor < 0 else text_len if cursor > text_len else cursor
+        )
 
     def split_selected_window(self, axis: str) -> int:
         if axis not in {"below", "right"}:
@@ -118,8 +204,10 @@ class EditorState:
 
         new_window_id = self._allocate_window_id()
         self.windows[new_window_id] = Window(id=new_window_id, buffer=selected_buffer)
-        self.window_points[new_window_id] = {selected_buffer: selected_point}
+        self.window_points[new_window_id, selected_buffer] = selected_point
 
+        # Resolve the parent index before the new split node exists.
+        parents = self._parent_index()
         split_id = self._allocate_split_id()
         split_ref: LayoutRef = ("split", split_id)
         self.splits[split_id] = SplitNode(
@@ -129,11 +217,17 @@ class EditorState:
             second=("window", new_window_id),
         )
 
-        self.layout_root = self._replace_ref(self.layout_root, selected_ref, split_ref)
+        self._replace_ref(selected_ref, split_ref)
+        parents[selected_ref] = (split_id, "first")
+        parents[("window", new_window_id)] = (split_id, "second")
+
+        order = self._window_order
+        if order is not None:
+            order.insert(order.index(selected_id) + 1, new_window_id)
         return new_window_id
 
     def other_window(self) -> int:
-        windows = self.window_list()
+        windows = self._ordered_windows()
         if len(windows) <= 1:
             return self.selected_window_id
 
@@ -142,13 +236,12 @@ class EditorState:
         return self.selected_window_id
 
     def delete_window(self) -> int:
-        windows = self.window_list()
-        if len(windows) <= 1:
+        if len(self._ordered_windows()) <= 1:
             raise ValueError("cannot delete the only window")
 
         selected = self.selected_window_id
         target_ref: LayoutRef = ("window", selected)
-        parent = self._find_parent(self.layout_root, target_ref)
+        parent = self._find_parent(target_ref)
         if parent is None:
             raise RuntimeError("cannot resolve parent split for selected window")
 
@@ -157,11 +250,17 @@ class EditorState:
         parent_node = self.splits[parent_id]
         sibling_ref = parent_node.second if side == "first" else parent_node.first
 
-        self.layout_root = self._replace_ref(self.layout_root, parent_ref, sibling_ref)
+        self._replace_ref(parent_ref, sibling_ref)
+        del self._parent_index()[target_ref]
 
         del self.windows[selected]
-        self.window_points.pop(selected, None)
+        self.window_points = {
+            key: point for key, point in self.window_points.items() if key[0] != selected
+        }
         del self.splits[parent_id]
+        order = self._window_order
+        if order is not None:
+            order.remove(selected)
 
         self.selected_window_id = self._first_window(sibling_ref)
         return self.selected_window_id
@@ -169,12 +268,16 @@ class EditorState:
     def delete_other_windows(self) -> int:
         selected = self.selected_window_id
         selected_window = self.windows[selected]
-        selected_points = self.window_points.get(selected, {})
 
         self.windows = {selected: selected_window}
-        self.window_points = {selected: dict(selected_points)}
+        self.window_points = {
+            key: point for key, point in self.window_points.items() if key[0] == selected
+        }
         self.splits = {}
         self.layout_root = ("window", selected)
+        self._window_order = None
+        self._parent_of = None
+        self._layout_tree = None
         self._ensure_window_point(selected, selected_window.buffer)
         return selected
 
@@ -182,7 +285,7 @@ class EditorState:
         target_window_id = self.selected_window_id
 
         if prefer_other:
-            for window_id in self.window_list():
+            for window_id in self._ordered_windows():
                 if window_id != self.selected_window_id:
                     target_window_id = window_id
                     break
@@ -192,12 +295,17 @@ class EditorState:
 
     def ensure_buffer(self, buffer_name: str) -> None:
         if buffer_name not in self.buffers:
-            self.buffers[buffer_name] = ""
+            # Interned keys let later lookups with interned names compare by identity.
+            buffer_name = sys.intern(buffer_name)
+            self.buffers[buffer_name] = GapBuffer()
+            insort(self._sorted_buffer_names, buffer_name)
+        else:
+            self.buffer(buffer_name)
 
     def mark_buffer_recent(self, buffer_name: str) -> None:
         self.ensure_buffer(buffer_name)
-        self.buffer_history = [item for item in self.buffer_history if item != buffer_name]
-        self.buffer_history.insert(0, buffer_name)
+        self.buffer_history[buffer_name] = None
+        self.buffer_history.move_to_end(buffer_name, last=False)
 
     def recent_buffer(self, *, exclude: set[str] | None = None) -> str | None:
         excluded = exclude or set()
@@ -220,12 +328,19 @@ class EditorState:
             raise KeyError(f"unknown buffer: {buffer_name}")
 
         del self.buffers[buffer_name]
+        names = self._sorted_buffer_names
+        index = bisect_left(names, buffer_name)
+        # Buffers added to `buffers` directly are not in the sorted list.
+        if index < len(names) and names[index] == buffer_name:
+            del names[index]
         self.buffer_keymaps.pop(buffer_name, None)
         self.buffer_modes.pop(buffer_name, None)
-        self.buffer_history = [name for name in self.buffer_history if name != buffer_name]
+        self.bump_keymap_revision()
+        self.buffer_history.pop(buffer_name, None)
 
-        for points in self.window_points.values():
-            points.pop(buffer_name, None)
+        self.window_points = {
+            key: point for key, point in self.window_points.items() if key[1] != buffer_name
+        }
 
         replacement = self.recent_buffer(exclude={buffer_name})
         if replacement is None:
@@ -240,83 +355,112 @@ class EditorState:
         self.mark_buffer_recent(replacement)
         return replacement
 
-    def _walk_windows(self, ref: LayoutRef) -> list[int]:
-        kind, node_id = ref
-        if kind == "window":
-            return [node_id]
+    def _ordered_windows(self) -> list[int]:
+        order = self._window_order
+        if order is None:
+            order = self._walk_windows(self.layout_root)
+            self._window_order = order
+        return order
 
-        split = self.splits[node_id]
-        return [*self._walk_windows(split.first), *self._walk_windows(split.second)]
+    def _walk_windows(self, ref: LayoutRef) -> list[int]:
+        windows: list[int] = []
+        stack = [ref]
+        while stack:
+            kind, node_id = stack.pop()
+            if kind == "window":
+                windows.append(node_id)
+            else:
+                split = self.splits[node_id]
+                stack.append(split.second)
+                stack.append(split.first)
+        return windows
 
     def _build_layout_tree(self, ref: LayoutRef) -> tuple[object, ...]:
-        kind, node_id = ref
-        if kind == "window":
-            return ("window", node_id)
-
-        split = self.splits[node_id]
-        return (
-            "split",
-            split.axis,
-            self._build_layout_tree(split.first),
-            self._build_layout_tree(split.second),
-        )
-
-    def _replace_ref(self, ref: LayoutRef, target: LayoutRef, replacement: LayoutRef) -> LayoutRef:
-        if ref == target:
-            return replacement
-
-        kind, node_id = ref
-        if kind == "window":
-            return ref
-
-        split = self.splits[node_id]
-        split.first = self._replace_ref(split.first, target, replacement)
-        split.second = self._replace_ref(split.second, target, replacement)
-        return ref
-
-    def _find_parent(
-        self,
-        ref: LayoutRef,
-        target: LayoutRef,
-        parent_id: int | None = None,
-        side: str | None = None,
-    ) -> tuple[int, str] | None:
-        if ref == target:
-            if parent_id is None or side is None:
-                return None
-            return parent_id, side
-
-        kind, node_id = ref
-        if kind == "window":
-            return None
+        # Post-order over an explicit stack: a split is emitted once both of
+        # its children have been pushed onto the results stack.
+        results: list[tuple[object, ...]] = []
+        stack: list[tuple[LayoutRef, bool]] = [(ref, False)]
+        while stack:
+            (kind, node_id), children_done = stack.pop()
+            if kind == "window":
+                results.append(("window", node_id))
+                continue
 
-        split = self.splits[node_id]
-        found = self._find_parent(split.first, target, node_id, "first")
-        if found is not None:
-            return found
+            split = self.splits[node_id]
+            if children_done:
+                second = results.pop()
+                first = results.pop()
+                results.append(("split", split.axis, first, second))
+            else:
+                stack.append(((kind, node_id), True))
+                stack.append((split.second, False))
+                stack.append((split.first, False))
+        return results[0]
+
+    def _replace_ref(self, target: LayoutRef, replacement: LayoutRef) -> None:
+        self._layout_tree = None
+        parents = self._parent_index()
+        parent = parents.pop(target, None)
+        if parent is None:
+            parents.pop(replacement, None)
+            self.layout_root = replacement
+            return
 
-        return self._find_parent(split.second, target, node_id, "second")
+        parent_id, side = parent
+        parents[replacement] = parent
+        setattr(self.splits[parent_id], side, replacement)
+
+    def _find_parent(self, target: LayoutRef) -> tuple[int, str] | None:
+        return self._parent_index().get(target)
+
+    def _parent_index(self) -> dict[LayoutRef, tuple[int, str]]:
+        parents = self._parent_of
+        if parents is None:
+            parents = {}
+            for split_id, split in self.splits.items():
+                parents[split.first] = (split_id, "first")
+                parents[split.second] = (split_id, "second")
+            self._parent_of = parents
+        return parents
 
     def _first_window(self, ref: LayoutRef) -> int:
         kind, node_id = ref
-        if kind == "window":
-            return node_id
-
-        split = self.splits[node_id]
-        return self._first_window(split.first)
+        while kind != "window":
+            kind, node_id = self.splits[node_id].first
+        return node_id
 
     def _window_point(self, window_id: int, buffer_name: str) -> int:
-        self._ensure_window_point(window_id, buffer_name)
-        point = self.window_points[window_id][buffer_name]
-        text_len = len(self.buffers[buffer_name])
-        clamped = max(0, min(point, text_len))
-        self.window_points[window_id][buffer_name] = clamped
+        self.ensure_buffer(buffer_name)
+        key = (window_id, buffer_name)
+        point = self.window_points.get(key, 0)
+        text_len = len(self.buffer(buffer_name))
+        clamped = 0 if point < 0 else text_len if point > text_len else point
+        self.window_points[key] = clamped
         return clamped
 
+    def _clamp_buffer_points(self, buffer_name: str) -> None:
+        # Every remembered point in the buffer is clamped, including those of windows
+        # showing another buffer, so a later regrow does not restore a stale offset.
+        points = self.window_points
+        source = self._point_windows_source
+        index = self._point_windows
+        if index is None or source is None or source[0] is not points or source[1] != len(points):
+            index = {}
+            for window_id, name in points:
+                index.setdefault(name, set()).add(window_id)
+            self._point_windows = index
+            self._point_windows_source = (points, len(points))
+
+        text_len = len(self.buffer(buffer_name))
+        for window_id in index.get(buffer_name, ()):
+            key = (window_id, buffer_name)
+            point = points.get(key)
+            if point is not None and point > text_len:
+                points[key] = text_len
+
     def _ensure_window_point(self, window_id: int, buffer_name: str) -> None:
         self.ensure_buffer(buffer_name)
-        points = self.window_points.setdefault(window_id, {})
-        points.setdefault(buffer_name, 0)
+        self.window_points.setdefault((window_id, buffer_name), 0)
 
     def _allocate_window_id(self) -> int:
         window_id = self.next_window_id
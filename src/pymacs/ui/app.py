@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from functools import lru_cache
+
 from rich.layout import Layout
 from rich.panel import Panel
 from rich.style import Style
 from rich.text import Text
 from textual.app import App, ComposeResult
-from textual.events import Key
+from textual.events import Key, Paste, Resize
+from textual.message import Message
 from textual.widgets import Input, Static
 
 from ..commands import register_builtin_commands
@@ -16,33 +20,103 @@ from .controller import (
     DEFAULT_CURSOR_STYLE,
     LayoutSnapshot,
     UIController,
+    UISnapshot,
     WindowSnapshot,
 )
 
 DEFAULT_MINIBUFFER_PLACEHOLDER = "M-x command"
 
 
+_TEXTUAL_MODIFIERS = {"ctrl": "C", "alt": "M", "shift": "S"}
+_MODIFIER_ORDER = ("C", "M", "S")
+
+
+@lru_cache(maxsize=512)
 def _key_to_sequence(key: str) -> str | None:
-    parts = key.lower().split("+")
-    mods: list[str] = []
-    base = ""
-    for part in parts:
-        if part == "ctrl":
-            mods.append("C")
-        elif part == "alt":
-            mods.append("M")
-        elif part == "shift":
-            mods.append("S")
-        else:
-            base = part
-    if not base or not mods:
+    lower = key.lower()
+    if "+" not in lower:
+        return None
+    *mod_parts, base = lower.split("+")
+    if not base or base in _TEXTUAL_MODIFIERS:
         return None
+    mods = [_TEXTUAL_MODIFIERS[part] for part in mod_parts if part in _TEXTUAL_MODIFIERS]
+    if not mods:
+        return None
+    if len(mods) == 1:
+        return f"{mods[0]}-{base}"
+    mods.sort(key=_MODIFIER_ORDER.index)
     return "-".join([*mods, base])
 
 
+def _visible_span(text: str, cursor: int, rows: int) -> tuple[int, int]:
+    """Return the [start, end) offsets of at most ROWS lines ending with point's line.
+
+    Lines above point are shown only while they fit, so buffers shorter than the
+    window render whole; ROWS <= 0 means the viewport size is not known yet.
+    """
+    if rows <= 0:
+        return 0, len(text)
+    start = text.rfind("\n", 0, cursor) + 1
+    for _ in range(rows - 1):
+        if start == 0:
+            break
+        start = text.rfind("\n", 0, start - 1) + 1
+
+    end = start
+    for _ in range(rows):
+        end = text.find("\n", end)
+        if end == -1:
+            return start, len(text)
+        end += 1
+    return start, end - 1
+
+
+def _window_text_rows(node: LayoutSnapshot, height: int) -> dict[int, int]:
+    """Return the text rows of each window pane when the layout is HEIGHT rows tall.
+
+    Stacked splits divide the height the way Rich's Layout does for two equal ratios
+    (first half rounded down, one-row minimum); each pane's border and mode line take
+    three rows.
+    """
+    rows: dict[int, int] = {}
+    stack = [(node, height)]
+    while stack:
+        current, current_height = stack.pop()
+        if current.kind == "window":
+            if current.window_id is not None:
+                rows[current.window_id] = max(0, current_height - 3)
+            continue
+        if current.first is None or current.second is None:
+            continue
+        if current.axis == "below":
+            first_height = current_height // 2 if current_height > 2 else 1
+            second_height = max(1, current_height - first_height)
+        else:
+            first_height = second_height = current_height
+        stack.append((current.first, first_height))
+        stack.append((current.second, second_height))
+    return rows
+
+
+@lru_cache(maxsize=32)
+def _parse_cursor_style(spec: str) -> Style | None:
+    # Rich caches successful parses but not failures; caching None here keeps an
+    # invalid cursor.style from raising and re-parsing on every repaint.
+    try:
+        return Style.parse(spec)
+    except Exception:
+        return None
+
+
 class WorkspaceView(Static):
     can_focus = True
 
+    class Resized(Message):
+        """Posted when the workspace size changes, since visible text depends on it."""
+
+    def on_resize(self, _event: Resize) -> None:
+        self.post_message(self.Resized())
+
 
 class PyMACSTuiApp(App[None]):
     """Core Textual frontend for PyMACS."""
@@ -79,19 +153,45 @@ class PyMACSTuiApp(App[None]):
         self._quit_requested = False
         self._last_cursor_warning: str | None = None
         self._cursor_style_warning: str | None = None
+        # Last rendered layout and the snapshot it was built from, plus each window's
+        # last panel, so refreshes rebuild only what changed. Panels are valid for the
+        # cursor settings in _rendered_cursor_key and the text rows they were cut for.
+        self._rendered_layout: Layout | None = None
+        self._rendered_layout_snapshot: LayoutSnapshot | None = None
+        self._rendered_cursor_key: tuple[str, str] | None = None
+        # Text rows each window's pane can show, for the layout and workspace height in
+        # _window_rows_key; windows missing from it (workspace not sized yet) show all.
+        self._window_rows: dict[int, int] = {}
+        self._window_rows_key: tuple[LayoutSnapshot, int] | None = None
+        self._window_panels: dict[int, tuple[WindowSnapshot, int, Panel]] = {}
+        self._last_snapshot: UISnapshot | None = None
+        self._last_workspace_height = -1
+        self._last_status_text: str | None = None
+        self._status_prefix_key: tuple[int, int] | None = None
+        self._status_prefix = ""
+        # Unselected window text, reused while the snapshot text is the same object
+        # and the visible span is unchanged.
+        self._text_cache: dict[int, tuple[str, int, int, Text]] = {}
 
     @property
     def quit_requested(self) -> bool:
         return self._quit_requested
 
     def compose(self) -> ComposeResult:
-        yield WorkspaceView(id="workspace")
-        yield Static(id="status")
-        yield Input(placeholder=DEFAULT_MINIBUFFER_PLACEHOLDER, id="minibuffer")
+        # Widget handles are kept so key handling never runs a selector query.
+        self._workspace_view = WorkspaceView(id="workspace")
+        self._status_bar = Static(id="status")
+        self._minibuffer_input = Input(placeholder=DEFAULT_MINIBUFFER_PLACEHOLDER, id="minibuffer")
+        yield self._workspace_view
+        yield self._status_bar
+        yield self._minibuffer_input
 
     def on_mount(self) -> None:
         self._hide_minibuffer()
-        self.query_one("#workspace", WorkspaceView).focus()
+        self._workspace_view.focus()
+        self._refresh_view()
+
+    def on_workspace_view_resized(self, _message: WorkspaceView.Resized) -> None:
         self._refresh_view()
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
@@ -103,8 +203,7 @@ class PyMACSTuiApp(App[None]):
         self._refresh_view()
 
     def on_key(self, event: Key) -> None:
-        minibuffer = self.query_one("#minibuffer", Input)
-        if minibuffer.display:
+        if self._minibuffer_input.display:
             if event.key in {"escape", "ctrl+g"}:
                 self.controller.dispatch_key_chord("C-g")
                 self._apply_ui_action()
@@ -143,19 +242,29 @@ class PyMACSTuiApp(App[None]):
             self._refresh_view()
             event.stop()
 
+    def on_paste(self, event: Paste) -> None:
+        if self._minibuffer_input.display:
+            return
+        # Insert the whole paste as one command instead of one key event per character.
+        text = event.text.replace("\r\n", "\n").replace("\r", "\n")
+        self.controller.handle_text_input(text)
+        self._apply_ui_action()
+        self._refresh_view()
+        event.stop()
+
     def _show_minibuffer(self, prompt: str | None = None) -> None:
-        minibuffer = self.query_one("#minibuffer", Input)
+        minibuffer = self._minibuffer_input
         minibuffer.placeholder = prompt or DEFAULT_MINIBUFFER_PLACEHOLDER
         minibuffer.display = True
         minibuffer.value = ""
         minibuffer.focus()
 
     def _hide_minibuffer(self) -> None:
-        minibuffer = self.query_one("#minibuffer", Input)
+        minibuffer = self._minibuffer_input
         minibuffer.placeholder = DEFAULT_MINIBUFFER_PLACEHOLDER
         minibuffer.value = ""
         minibuffer.display = False
-        self.query_one("#workspace", WorkspaceView).focus()
+        self._workspace_view.focus()
 
     def _apply_ui_action(self) -> None:
         action = self.controller.pop_ui_action()
@@ -173,19 +282,73 @@ class PyMACSTuiApp(App[None]):
 
     def _refresh_view(self) -> None:
         snapshot = self.controller.snapshot()
-        workspace_widget = self.query_one("#workspace", Static)
-        status_widget = self.query_one("#status", Static)
-
-        windows_by_id = {window.window_id: window for window in snapshot.windows}
-        self._cursor_style_warning = None
-        workspace_widget.update(
-            self._render_layout(
+        workspace_widget = self._workspace_view
+        workspace_height = workspace_widget.size.height
+        # Keys that change nothing visible (e.g. a pending prefix) skip the repaint;
+        # a resize changes the height and still recuts the visible text.
+        if snapshot == self._last_snapshot and workspace_height == self._last_workspace_height:
+            return
+        self._last_snapshot = snapshot
+        self._last_workspace_height = workspace_height
+        status_widget = self._status_bar
+
+        windows_by_id = snapshot.windows_by_id
+        rows_key = (snapshot.layout, workspace_height)
+        if rows_key != self._window_rows_key:
+            self._window_rows_key = rows_key
+            self._window_rows = (
+                _window_text_rows(snapshot.layout, workspace_height) if workspace_height > 0 else {}
+            )
+        cursor_key = (snapshot.cursor_format, snapshot.cursor_style)
+        if cursor_key != self._rendered_cursor_key:
+            # Cached panels and the cursor style warning depend only on these settings.
+            self._rendered_cursor_key = cursor_key
+            self._window_panels.clear()
+            self._cursor_style_warning = None
+
+        layout = self._rendered_layout
+        workspace_changed = False
+        if layout is None or snapshot.layout != self._rendered_layout_snapshot:
+            workspace_changed = True
+            layout = self._render_layout(
                 snapshot.layout,
                 windows_by_id,
                 cursor_format=snapshot.cursor_format,
                 cursor_style=snapshot.cursor_style,
             )
-        )
+            self._rendered_layout = layout
+            self._rendered_layout_snapshot = snapshot.layout
+        else:
+            for window_id, window in windows_by_id.items():
+                cached = self._window_panels.get(window_id)
+                if (
+                    cached is not None
+                    and cached[0] == window
+                    and cached[1] == self._window_rows.get(window_id, 0)
+                ):
+                    continue
+                workspace_changed = True
+                layout[f"window-{window_id}"].update(
+                    self._render_window(
+                        window,
+                        cursor_format=snapshot.cursor_format,
+                        cursor_style=snapshot.cursor_style,
+                    )
+                )
+
+        if len(self._window_panels) > len(windows_by_id):
+            self._window_panels = {
+                window_id: cached
+                for window_id, cached in self._window_panels.items()
+                if window_id in windows_by_id
+            }
+            self._text_cache = {
+                window_id: cached
+                for window_id, cached in self._text_cache.items()
+                if window_id in windows_by_id
+            }
+        if workspace_changed:
+            workspace_widget.update(layout)
 
         warning = snapshot.cursor_warning or self._cursor_style_warning
         status = snapshot.status
@@ -195,16 +358,20 @@ class PyMACSTuiApp(App[None]):
                 self._last_cursor_warning = warning
         else:
             self._last_cursor_warning = None
-        status_widget.update(
-            Text(
-                f"windows={len(snapshot.windows)} selected={snapshot.selected_window_id} | {status}"
-            )
-        )
+        prefix_key = (len(snapshot.windows), snapshot.selected_window_id)
+        if prefix_key != self._status_prefix_key:
+            # The window summary only changes on window commands; format it then.
+            self._status_prefix_key = prefix_key
+            self._status_prefix = f"windows={prefix_key[0]} selected={prefix_key[1]} | "
+        status_text = self._status_prefix + status
+        if status_text != self._last_status_text:
+            self._last_status_text = status_text
+            status_widget.update(Text(status_text))
 
     def _render_layout(
         self,
         layout_node: LayoutSnapshot,
-        windows_by_id: dict[int, WindowSnapshot],
+        windows_by_id: Mapping[int, WindowSnapshot],
         *,
         cursor_format: str,
         cursor_style: str,
@@ -256,8 +423,14 @@ class PyMACSTuiApp(App[None]):
         cursor_format: str,
         cursor_style: str,
     ) -> Panel:
+        rows = self._window_rows.get(window.window_id, 0)
+        cached = self._window_panels.get(window.window_id)
+        if cached is not None and cached[0] == window and cached[1] == rows:
+            return cached[2]
+
         rendered_text = self._render_window_text(
             window,
+            rows,
             cursor_format=cursor_format,
             cursor_style=cursor_style,
         )
@@ -272,27 +445,43 @@ class PyMACSTuiApp(App[None]):
             Layout(name="content", renderable=rendered_text, ratio=1),
             Layout(name="mode-line", renderable=local_status, size=1),
         )
-        return Panel(
+        panel = Panel(
             body,
             title=f"Window {window.window_id}",
             border_style="bright_green" if window.selected else "white",
             padding=(0, 1),
         )
+        self._window_panels[window.window_id] = (window, rows, panel)
+        return panel
 
     def _render_window_text(
         self,
         window: WindowSnapshot,
+        rows: int,
         *,
         cursor_format: str,
         cursor_style: str,
     ) -> Text:
+        cursor = max(0, min(window.cursor, len(window.text)))
+        view_start, view_end = _visible_span(window.text, cursor, rows)
         if not window.selected:
-            return Text(window.text)
+            cached = self._text_cache.get(window.window_id)
+            if (
+                cached is not None
+                and cached[0] is window.text
+                and cached[1] == view_start
+                and cached[2] == view_end
+            ):
+                return cached[3]
+            text = Text(window.text[view_start:view_end])
+            self._text_cache[window.window_id] = (window.text, view_start, view_end, text)
+            return text
 
-        cursor = max(0, min(window.cursor, len(window.text)))
+        visible = window.text[view_start:view_end]
+        cursor -= view_start
         if cursor_format == "char":
-            text = Text(window.text)
-            if cursor >= len(window.text):
+            text = Text(visible)
+            if cursor >= len(visible):
                 text.append(" ")
                 start = len(text.plain) - 1
                 end = start + 1
@@ -300,15 +489,21 @@ class PyMACSTuiApp(App[None]):
                 start = cursor
                 end = start + 1
         else:
-            rendered = window.text[:cursor] + cursor_format + window.text[cursor:]
-            text = Text(rendered)
+            # Text keeps appended segments and joins them once when rendered, so the
+            # marker is spliced in without building an intermediate full string.
+            if cursor < len(visible):
+                text = Text(visible[:cursor])
+                text.append(cursor_format)
+                text.append(visible[cursor:])
+            else:
+                text = Text(visible)
+                text.append(cursor_format)
             start = cursor
             end = cursor + len(cursor_format)
 
-        try:
-            style = Style.parse(cursor_style) if cursor_style else None
-        except Exception:
-            style = Style.parse(DEFAULT_CURSOR_STYLE)
+        style = _parse_cursor_style(cursor_style) if cursor_style else None
+        if cursor_style and style is None:
+            style = _parse_cursor_style(DEFAULT_CURSOR_STYLE)
             self._cursor_style_warning = (
                 f"invalid cursor.style; fallback to {DEFAULT_CURSOR_STYLE}"
             )
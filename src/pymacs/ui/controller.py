@@ -3,8 +3,13 @@
 from __future__ import annotations
 
 import shlex
-from collections.abc import Callable
-from dataclasses import dataclass
+import sys
+from bisect import bisect_left
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final
 
 from ..core import Editor
 from ..keymap import KeySequence, format_key_sequence, parse_key_sequence
@@ -13,7 +18,7 @@ from ..keymap import KeySequence, format_key_sequence, parse_key_sequence
 DEFAULT_CURSOR_FORMAT = "char"
 DEFAULT_CURSOR_STYLE = "reverse blink"
 
-DEFAULT_EDIT_BINDINGS: tuple[tuple[str, str], ...] = (
+DEFAULT_EDIT_BINDINGS: Final[tuple[tuple[str, str], ...]] = (
     ("C-m", "newline"),
     ("DEL", "delete-backward-char"),
     ("C-d", "delete-forward-char"),
@@ -26,19 +31,40 @@ DEFAULT_EDIT_BINDINGS: tuple[tuple[str, str], ...] = (
     ("C-k", "kill-line"),
 )
 
-UI_ACTION_BINDINGS: dict[KeySequence, str] = {
+
+def _parse_default_edit_bindings() -> tuple[tuple[KeySequence, str], ...]:
+    parsed: list[tuple[KeySequence, str]] = []
+    for sequence, command_name in DEFAULT_EDIT_BINDINGS:
+        try:
+            parsed.append((parse_key_sequence(sequence), command_name))
+        except ValueError:
+            continue
+    return tuple(parsed)
+
+
+# Parsed once at import; every controller binds the same default keys.
+_DEFAULT_EDIT_KEYS = _parse_default_edit_bindings()
+
+
+UI_ACTION_BINDINGS: Final[dict[KeySequence, str]] = {
     ("M-x",): "open-minibuffer",
     ("C-q",): "quit",
     ("C-x", "C-c"): "quit",
 }
 
-HELP_PROMPT_BINDINGS: dict[str, tuple[str, str]] = {
+ACTION_STATUSES: Final[dict[str, str]] = {
+    "open-minibuffer": "open minibuffer",
+    "cancel-minibuffer": "cancelled",
+    "quit": "quit requested",
+}
+
+HELP_PROMPT_BINDINGS: Final[dict[str, tuple[str, str]]] = {
     "f": ("describe-command", "Describe command:"),
     "k": ("describe-key", "Describe key:"),
     "w": ("where-is", "Where is command:"),
 }
 
-CTRL_X_COMMAND_BINDINGS: dict[str, str] = {
+CTRL_X_COMMAND_BINDINGS: Final[dict[str, str]] = {
     "2": "split-window-below",
     "3": "split-window-right",
     "o": "other-window",
@@ -47,13 +73,59 @@ CTRL_X_COMMAND_BINDINGS: dict[str, str] = {
     "C-b": "list-buffers",
 }
 
-CTRL_X_PROMPT_BINDINGS: dict[str, tuple[str, bool, str]] = {
+CTRL_X_PROMPT_BINDINGS: Final[dict[str, tuple[str, bool, str]]] = {
     "b": ("switch-to-buffer", True, "Switch to buffer:"),
     "k": ("kill-buffer", False, "Kill buffer:"),
 }
 
+# Minimum argument count and usage line for minibuffer commands that take arguments;
+# execute_minibuffer checks the count before calling the handler.
+MINIBUFFER_USAGE: Final[dict[str, tuple[int, str]]] = {
+    "run": (1, "usage: run <cmd> [args...]"),
+    "bind": (2, "usage: bind <key> <cmd> [global|buffer|mode:<name>]"),
+    "press": (1, "usage: press <key> [args...]"),
+    "mode": (1, "usage: mode <name> [on|off]"),
+}
+
+
+def _ui_prefixes() -> frozenset[KeySequence]:
+    bound: list[KeySequence] = [*UI_ACTION_BINDINGS]
+    bound.extend(("C-h", subkey) for subkey in HELP_PROMPT_BINDINGS)
+    bound.extend(("C-x", subkey) for subkey in CTRL_X_COMMAND_BINDINGS)
+    bound.extend(("C-x", subkey) for subkey in CTRL_X_PROMPT_BINDINGS)
+    return frozenset(sequence[:end] for sequence in bound for end in range(1, len(sequence)))
+
+
+# Every proper prefix of a UI-level binding, so prefix checks are one set lookup.
+_UI_PREFIXES = _ui_prefixes()
+
 
-@dataclass(frozen=True)
+def _split_command_line(line: str) -> tuple[str, ...]:
+    """Split a minibuffer line shell-style, raising ValueError on bad quoting."""
+    parts, error = _parse_command_line(line)
+    if error is not None:
+        raise ValueError(error)
+    return parts
+
+
+_SHLEX_WHITESPACE_TO_SPACE: Final = str.maketrans("\t\r\n", "   ")
+
+
+@lru_cache(maxsize=256)
+def _parse_command_line(line: str) -> tuple[tuple[str, ...], str | None]:
+    # Parse errors are cached as messages too, since lru_cache does not cache raises.
+    if "'" not in line and '"' not in line and "\\" not in line:
+        # Split only on shlex's whitespace; str.split() would also split on NBSP,
+        # vertical tab and other Unicode spaces that shlex keeps inside a token.
+        spaced = line.translate(_SHLEX_WHITESPACE_TO_SPACE)
+        return tuple(part for part in spaced.split(" ") if part), None
+    try:
+        return tuple(shlex.split(line)), None
+    except ValueError as exc:
+        return (), str(exc)
+
+
+@dataclass(frozen=True, slots=True)
 class WindowSnapshot:
     """Immutable per-window rendering state."""
 
@@ -67,7 +139,7 @@ class WindowSnapshot:
     selected: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LayoutSnapshot:
     """Immutable layout tree for rendering."""
 
@@ -78,7 +150,7 @@ class LayoutSnapshot:
     second: LayoutSnapshot | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UISnapshot:
     """Immutable UI state for rendering."""
 
@@ -89,9 +161,15 @@ class UISnapshot:
     cursor_style: str
     cursor_warning: str | None
     status: str
+    # Read-only index over `windows`, derived from it; excluded from comparisons.
+    windows_by_id: Mapping[int, WindowSnapshot] = field(init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        windows_by_id = MappingProxyType({window.window_id: window for window in self.windows})
+        object.__setattr__(self, "windows_by_id", windows_by_id)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UIAction:
     """UI actions consumed by the Textual layer."""
 
@@ -99,47 +177,108 @@ class UIAction:
     prompt: str | None = None
 
 
+@lru_cache(maxsize=None)
+def _ui_action(name: str, prompt: str | None = None) -> UIAction:
+    # Actions and prompts come from the fixed binding tables, so each distinct
+    # action is built once and shared; UIAction is immutable.
+    return UIAction(name=name, prompt=prompt)
+
+
 class UIController:
     """Stateful adapter between UI events and editor core APIs."""
 
     def __init__(self, editor: Editor) -> None:
         self.editor = editor
         self._status = "ready"
-        self._pending_keys: list[str] = []
+        self._pending_keys: KeySequence = ()
         self._ui_action: UIAction | None = None
         self._minibuffer_handler: Callable[[str], str] | None = None
+        self._minibuffer_commands: dict[str, Callable[[list[str]], str]] = {
+            "run": self._run_command,
+            "bind": self._bind_command,
+            "press": self._press_command,
+            "mode": self._mode_command,
+            "modes": self._modes_command,
+            "buf": self._buf_command,
+            "commands": self._commands_command,
+            "help": self._help_command,
+        }
+        self._help_status = "commands: " + " ".join(self._minibuffer_commands)
+        # Snapshots from the previous call, reused while their inputs are unchanged so
+        # renderer caches see identical objects between refreshes.
+        self._window_snapshots: dict[int, WindowSnapshot] = {}
+        self._layout_snapshot: tuple[tuple[object, ...], LayoutSnapshot] | None = None
+        # Per-buffer mode tuples; mode changes bump keymap_revision, which clears them.
+        self._mode_tuples: dict[str, tuple[str, ...]] = {}
+        self._mode_tuples_revision = -1
+        # Per-buffer dispatch kind of each key sequence seen, merging UI actions with the
+        # editor keymaps so a keystroke is one lookup; cleared when keymap_revision moves.
+        self._key_kinds: dict[str, dict[KeySequence, tuple[str, str]]] = {}
+        self._key_kinds_revision = -1
         self._bind_default_edit_keys()
 
     def snapshot(self) -> UISnapshot:
         windows: list[WindowSnapshot] = []
         selected_window_id = self.editor.selected_window_id
         cursor_format, cursor_style, cursor_warning = self._cursor_config()
+        previous_snapshots = self._window_snapshots
+        window_snapshots: dict[int, WindowSnapshot] = {}
+        state = self.editor.state
+        if self._mode_tuples_revision != state.keymap_revision:
+            self._mode_tuples_revision = state.keymap_revision
+            self._mode_tuples = {}
+        mode_tuples = self._mode_tuples
 
         for window_id in self.editor.window_list():
             buffer_name = self.editor.window_buffer(window_id)
-            text = self.editor.state.buffers.get(buffer_name, "")
+            text = self.editor.state.buffer_text(buffer_name)
             cursor = self.editor.state.window_cursor(window_id)
-            line_start = text.rfind("\n", 0, cursor) + 1
-            line = text.count("\n", 0, cursor) + 1
-            col = cursor - line_start + 1
-            modes = tuple(self.editor.state.buffer_modes.get(buffer_name, []))
-            windows.append(
-                WindowSnapshot(
+            modes = mode_tuples.get(buffer_name)
+            if modes is None:
+                modes = tuple(state.buffer_modes.get(buffer_name, ()))
+                mode_tuples[buffer_name] = modes
+            selected = window_id == selected_window_id
+            window = previous_snapshots.get(window_id)
+            if (
+                window is None
+                or window.text is not text
+                or window.cursor != cursor
+                or window.buffer != buffer_name
+                or window.modes != modes
+                or window.selected != selected
+            ):
+                # The buffer's newline index turns line/column into bisects
+                # instead of scanning the text up to point.
+                buffer = self.editor.state.buffer(buffer_name)
+                line = bisect_left(buffer.newlines(), cursor) + 1
+                line_start = buffer.line_start(cursor)
+                window = WindowSnapshot(
                     window_id=window_id,
                     buffer=buffer_name,
                     text=text,
                     cursor=cursor,
                     line=line,
-                    col=col,
+                    col=cursor - line_start + 1,
                     modes=modes,
-                    selected=window_id == selected_window_id,
+                    selected=selected,
                 )
-            )
+            window_snapshots[window_id] = window
+            windows.append(window)
+        self._window_snapshots = window_snapshots
+
+        tree = self.editor.state.layout_tree()
+        cached_layout = self._layout_snapshot
+        # layout_tree() returns the same object until the layout changes.
+        if cached_layout is not None and cached_layout[0] is tree:
+            layout = cached_layout[1]
+        else:
+            layout = self._layout_from_tree(tree)
+            self._layout_snapshot = (tree, layout)
 
         return UISnapshot(
             selected_window_id=selected_window_id,
             windows=tuple(windows),
-            layout=self._layout_from_tree(self.editor.state.layout_tree()),
+            layout=layout,
             cursor_format=cursor_format,
             cursor_style=cursor_style,
             cursor_warning=cursor_warning,
@@ -149,15 +288,18 @@ class UIController:
     def handle_text_input(self, text: str) -> str:
         if not text:
             return self._status
-        self._pending_keys.clear()
+        self._pending_keys = ()
         self._ui_action = None
         self.editor.run("insert", text)
         if text == "\n":
             return self._set_status("inserted newline")
+        if len(text) == 1:
+            # Plain typing: a constant status avoids formatting a string per keystroke.
+            return self._set_status("inserted 1 char(s)")
         return self._set_status(f"inserted {len(text)} char(s)")
 
     def handle_backspace(self) -> str:
-        self._pending_keys.clear()
+        self._pending_keys = ()
         self._ui_action = None
         before = self.editor.state.current_cursor()
         self.editor.run("delete-backward-char")
@@ -177,14 +319,14 @@ class UIController:
         try:
             sequence = parse_key_sequence(chord)
         except ValueError as exc:
-            self._pending_keys.clear()
+            self._pending_keys = ()
             self._ui_action = None
             return self._set_status(str(exc))
 
-        status = self._status
-        for key in sequence:
-            status = self._dispatch_single_key(key)
-        return status
+        # Only the last key's status is observable; earlier prefix keys skip formatting it.
+        for key in sequence[:-1]:
+            self._dispatch_single_key(key, final=False)
+        return self._dispatch_single_key(sequence[-1])
 
     def has_pending_keys(self) -> bool:
         return bool(self._pending_keys)
@@ -195,10 +337,19 @@ class UIController:
         return action
 
     def execute_key(self, sequence: str, *args: object) -> str:
-        self._pending_keys.clear()
+        self._pending_keys = ()
         self._ui_action = None
         try:
-            result = self.editor.command_execute(sequence, *args)
+            command_name = self.editor.resolve_key(sequence)
+        except KeyError as exc:
+            return self._set_status(exc.args[0])
+        except ValueError as exc:
+            return self._set_status(f"command error: {exc}")
+        return self._run_key_command(sequence, command_name, args)
+
+    def _run_key_command(self, sequence: str, command_name: str, args: tuple[object, ...]) -> str:
+        try:
+            result = self.editor.run(command_name, *args)
         except KeyError as exc:
             return self._set_status(exc.args[0])
         except Exception as exc:
@@ -209,35 +360,22 @@ class UIController:
 
     def execute_minibuffer(self, line: str) -> str:
         try:
-            parts = shlex.split(line)
+            parts = _split_command_line(line)
         except ValueError as exc:
             return self._set_status(f"parse error: {exc}")
 
         if not parts:
             return self._set_status("empty command")
 
-        cmd, args = parts[0], parts[1:]
-        try:
-            if cmd == "run":
-                return self._run_command(args)
-            if cmd == "bind":
-                return self._bind_command(args)
-            if cmd == "press":
-                return self._press_command(args)
-            if cmd == "mode":
-                return self._mode_command(args)
-            if cmd == "modes":
-                modes = self.editor.state.current_modes()
-                return self._set_status(", ".join(modes) if modes else "(none)")
-            if cmd == "buf":
-                return self._set_status(self.editor.state.selected_buffer())
-            if cmd == "commands":
-                return self._set_status(" ".join(self.editor.commands))
-            if cmd == "help":
-                return self._set_status(
-                    "commands: run bind press mode modes buf commands help"
-                )
+        cmd, args = parts[0], list(parts[1:])
+        handler = self._minibuffer_commands.get(cmd)
+        if handler is None:
             return self._set_status(f"unknown command: {cmd}")
+        usage = MINIBUFFER_USAGE.get(cmd)
+        if usage is not None and len(args) < usage[0]:
+            return self._set_status(usage[1])
+        try:
+            return handler(args)
         except KeyError as exc:
             return self._set_status(exc.args[0])
         except ValueError as exc:
@@ -245,82 +383,115 @@ class UIController:
         except Exception as exc:
             return self._set_status(f"command error: {exc}")
 
-    def _dispatch_single_key(self, key: str) -> str:
+    def _dispatch_single_key(self, key: str, *, final: bool = True) -> str:
         if key == "C-g":
-            self._pending_keys.clear()
+            self._pending_keys = ()
             self._minibuffer_handler = None
-            self._ui_action = UIAction(name="cancel-minibuffer")
+            self._ui_action = _ui_action("cancel-minibuffer")
             return self._set_status("cancelled")
 
-        candidate = tuple([*self._pending_keys, key])
         self._ui_action = None
-
-        if len(candidate) == 2 and candidate[0] == "C-h":
-            return self._handle_help_prefix(candidate)
-
-        if len(candidate) == 2 and candidate[0] == "C-x":
-            return self._handle_ctrl_x_prefix(candidate)
+        pending = self._pending_keys
+        if not pending:
+            # Most keys arrive with nothing pending; skip the two-key prefix handlers.
+            candidate: KeySequence = (key,)
+        else:
+            candidate = pending + (key,)
+            if len(candidate) == 2 and candidate[0] == "C-h":
+                return self._handle_help_prefix(candidate)
+
+            if len(candidate) == 2 and candidate[0] == "C-x":
+                return self._handle_ctrl_x_prefix(candidate)
+
+        kind, target = self._classify_key(candidate)
+        if kind == "action":
+            self._pending_keys = ()
+            self._ui_action = _ui_action(target)
+            return self._set_status(self._action_status(target))
+
+        if kind == "command":
+            self._pending_keys = ()
+            # Already resolved, so run it directly rather than resolving again.
+            return self._run_key_command(format_key_sequence(candidate), target, ())
+
+        if kind == "prefix":
+            self._pending_keys = candidate
+            if not final:
+                return self._status
+            return self._set_status(target)
+
+        self._pending_keys = ()
+        return self._set_status(target)
+
+    def _classify_key(self, candidate: KeySequence) -> tuple[str, str]:
+        """Return how CANDIDATE dispatches in the selected buffer: action, command, prefix or unbound.
+
+        The second item is the action or command name, or the status message for
+        prefix and unbound sequences so repeated keys reuse the formatted string.
+        """
+        revision = self.editor.state.keymap_revision
+        if revision != self._key_kinds_revision:
+            self._key_kinds.clear()
+            self._key_kinds_revision = revision
+        buffer = self.editor.state.selected_buffer()
+        kinds = self._key_kinds.get(buffer)
+        if kinds is None:
+            kinds = self._key_kinds[buffer] = {}
+
+        entry = kinds.get(candidate)
+        if entry is not None:
+            return entry
 
         action = UI_ACTION_BINDINGS.get(candidate)
+        command_name = None if action is not None else self.editor.lookup_key(candidate, buffer=buffer)
         if action is not None:
-            self._pending_keys.clear()
-            self._ui_action = UIAction(name=action)
-            return self._set_status(self._action_status(action))
-
-        try:
-            command_name = self.editor.resolve_key(candidate)
-        except KeyError:
-            command_name = None
-
-        if command_name is not None:
-            self._pending_keys.clear()
-            return self.execute_key(format_key_sequence(candidate))
-
-        has_prefix = self.editor.has_prefix_binding(candidate) or self._has_ui_prefix(candidate)
-        if has_prefix:
-            self._pending_keys = list(candidate)
-            return self._set_status(f"pending {format_key_sequence(candidate)}")
-
-        self._pending_keys.clear()
-        return self._set_status(f"unbound key sequence: {format_key_sequence(candidate)}")
+            entry = ("action", action)
+        elif command_name is not None:
+            entry = ("command", command_name)
+        elif self.editor.has_prefix_binding(candidate, buffer=buffer) or self._has_ui_prefix(candidate):
+            entry = ("prefix", f"pending {format_key_sequence(candidate)}")
+        else:
+            entry = ("unbound", f"unbound key sequence: {format_key_sequence(candidate)}")
+        kinds[candidate] = entry
+        return entry
 
     def _handle_help_prefix(self, candidate: KeySequence) -> str:
         binding = HELP_PROMPT_BINDINGS.get(candidate[1])
         if binding is None:
-            self._pending_keys.clear()
+            self._pending_keys = ()
             return self._set_status(f"unbound key sequence: {format_key_sequence(candidate)}")
 
         command_name, prompt = binding
-        self._pending_keys.clear()
+        self._pending_keys = ()
         self._minibuffer_handler = self._build_minibuffer_command_handler(command_name, require_arg=True)
-        self._ui_action = UIAction(name="open-minibuffer", prompt=prompt)
+        self._ui_action = _ui_action("open-minibuffer", prompt)
         return self._set_status(prompt)
 
     def _handle_ctrl_x_prefix(self, candidate: KeySequence) -> str:
         subkey = candidate[1]
 
         if subkey in CTRL_X_COMMAND_BINDINGS:
-            self._pending_keys.clear()
+            self._pending_keys = ()
             return self._run_editor_command(CTRL_X_COMMAND_BINDINGS[subkey])
 
         prompt_binding = CTRL_X_PROMPT_BINDINGS.get(subkey)
         if prompt_binding is not None:
             command_name, require_arg, prompt = prompt_binding
-            self._pending_keys.clear()
+            self._pending_keys = ()
             self._minibuffer_handler = self._build_minibuffer_command_handler(
                 command_name,
                 require_arg=require_arg,
             )
-            self._ui_action = UIAction(name="open-minibuffer", prompt=prompt)
+            self._ui_action = _ui_action("open-minibuffer", prompt)
             return self._set_status(prompt)
 
         action = UI_ACTION_BINDINGS.get(candidate)
         if action is not None:
-            self._pending_keys.clear()
-            self._ui_action = UIAction(name=action)
+            self._pending_keys = ()
+            self._ui_action = _ui_action(action)
             return self._set_status(self._action_status(action))
 
-        self._pending_keys.clear()
+        self._pending_keys = ()
         return self._set_status(f"unbound key sequence: {format_key_sequence(candidate)}")
 
     def _build_minibuffer_command_handler(
@@ -329,8 +500,8 @@ class UIController:
         *,
         require_arg: bool,
     ) -> Callable[[str], str]:
-        def _handler(raw_value: str) -> str:
-            value = raw_value.strip()
+        # handle_minibuffer_submit strips the line before calling the handler.
+        def _handler(value: str) -> str:
             if require_arg and not value:
                 return self._set_status(f"usage: {command_name} <arg>")
 
@@ -367,19 +538,14 @@ class UIController:
         return self._set_status(str(result))
 
     def _run_command(self, args: list[str]) -> str:
-        if not args:
-            return self._set_status("usage: run <cmd> [args...]")
-        name, rest = args[0], args[1:]
+        name, rest = sys.intern(args[0]), args[1:]
         result = self.editor.run(name, *rest)
         if result is None:
             return self._set_status(f"ran {name}")
         return self._set_status(str(result))
 
     def _bind_command(self, args: list[str]) -> str:
-        if len(args) < 2:
-            return self._set_status("usage: bind <key> <cmd> [global|buffer|mode:<name>]")
-
-        key, command_name = args[0], args[1]
+        key, command_name = args[0], sys.intern(args[1])
         scope_spec = args[2] if len(args) >= 3 else "global"
 
         if scope_spec == "global":
@@ -395,25 +561,19 @@ class UIController:
         if scope_spec.startswith("mode:"):
             mode = scope_spec.split(":", 1)[1]
             if not mode:
-                return self._set_status(
-                    "usage: bind <key> <cmd> [global|buffer|mode:<name>]"
-                )
+                return self._set_status(MINIBUFFER_USAGE["bind"][1])
             self.editor.bind_key(key, command_name, scope="mode", mode=mode)
             return self._set_status(f"bound {key} -> {command_name} (mode:{mode})")
 
-        return self._set_status("usage: bind <key> <cmd> [global|buffer|mode:<name>]")
+        return self._set_status(MINIBUFFER_USAGE["bind"][1])
 
     def _press_command(self, args: list[str]) -> str:
-        if not args:
-            return self._set_status("usage: press <key> [args...]")
-        key, rest = args[0], args[1:]
+        key, rest = sys.intern(args[0]), args[1:]
         if rest:
             return self.execute_key(key, *rest)
         return self.dispatch_key_chord(key)
 
     def _mode_command(self, args: list[str]) -> str:
-        if not args:
-            return self._set_status("usage: mode <name> [on|off]")
         mode = args[0]
         action = args[1] if len(args) >= 2 else "on"
         if action == "on":
@@ -422,18 +582,27 @@ class UIController:
         if action == "off":
             self.editor.disable_mode(mode)
             return self._set_status(f"mode {mode}: off")
-        return self._set_status("usage: mode <name> [on|off]")
+        return self._set_status(MINIBUFFER_USAGE["mode"][1])
+
+    def _modes_command(self, _args: list[str]) -> str:
+        modes = self.editor.state.current_modes()
+        return self._set_status(", ".join(modes) if modes else "(none)")
+
+    def _buf_command(self, _args: list[str]) -> str:
+        return self._set_status(self.editor.state.selected_buffer())
+
+    def _commands_command(self, _args: list[str]) -> str:
+        return self._set_status(self.editor.command_names_line())
+
+    def _help_command(self, _args: list[str]) -> str:
+        return self._set_status(self._help_status)
 
     def _set_status(self, message: str) -> str:
         self._status = message
         return message
 
     def _bind_default_edit_keys(self) -> None:
-        for sequence, command_name in DEFAULT_EDIT_BINDINGS:
-            try:
-                key = parse_key_sequence(sequence)
-            except ValueError:
-                continue
+        for key, command_name in _DEFAULT_EDIT_KEYS:
             if key in self.editor.state.global_keymap:
                 continue
             try:
@@ -442,35 +611,10 @@ class UIController:
                 continue
 
     def _has_ui_prefix(self, sequence: KeySequence) -> bool:
-        for bound in UI_ACTION_BINDINGS:
-            if len(bound) > len(sequence) and bound[: len(sequence)] == sequence:
-                return True
-
-        for subkey in HELP_PROMPT_BINDINGS:
-            bound = ("C-h", subkey)
-            if len(bound) > len(sequence) and bound[: len(sequence)] == sequence:
-                return True
-
-        for subkey in CTRL_X_COMMAND_BINDINGS:
-            bound = ("C-x", subkey)
-            if len(bound) > len(sequence) and bound[: len(sequence)] == sequence:
-                return True
-
-        for subkey in CTRL_X_PROMPT_BINDINGS:
-            bound = ("C-x", subkey)
-            if len(bound) > len(sequence) and bound[: len(sequence)] == sequence:
-                return True
-
-        return False
+        return sequence in _UI_PREFIXES
 
     def _action_status(self, action: str) -> str:
-        if action == "open-minibuffer":
-            return "open minibuffer"
-        if action == "cancel-minibuffer":
-            return "cancelled"
-        if action == "quit":
-            return "quit requested"
-        return action
+        return ACTION_STATUSES.get(action, action)
 
     def _layout_from_tree(self, tree: tuple[object, ...]) -> LayoutSnapshot:
         kind = str(tree[0])
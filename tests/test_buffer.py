@@ -0,0 +1,64 @@
+from pymacs.buffer import GapBuffer
+
+
+def test_gap_buffer_insert_and_delete_at_gap() -> None:
+    buf = GapBuffer("abc")
+    buf.insert(3, "d")
+    buf.insert(4, "ef")
+    assert buf.text() == "abcdef"
+    assert len(buf) == 6
+
+    buf.delete(4, 6)
+    assert buf.text() == "abcd"
+
+    buf.delete(0, 1)
+    assert buf.text() == "bcd"
+    assert len(buf) == 3
+
+
+def test_gap_buffer_moves_gap_for_edits_elsewhere() -> None:
+    buf = GapBuffer("hello world")
+    buf.insert(5, ",")
+    assert buf.text() == "hello, world"
+
+    buf.insert(0, ">> ")
+    buf.delete(9, 10)
+    assert buf.text() == ">> hello,world"
+
+    buf.replace("x")
+    buf.delete(-3, 10)
+    assert buf.text() == ""
+    assert len(buf) == 0
+
+
+def test_gap_buffer_line_bounds_track_edits() -> None:
+    buf = GapBuffer("ab\ncd\n\nef")
+    assert buf.newlines() == [2, 5, 6]
+    assert (buf.line_start(4), buf.line_end(4)) == (3, 5)
+    assert (buf.line_start(6), buf.line_end(6)) == (6, 6)
+    assert (buf.line_start(9), buf.line_end(9)) == (7, 9)
+
+    buf.insert(0, "x\n")
+    assert buf.newlines() == [1, 4, 7, 8]
+    buf.delete(3, 5)
+    assert buf.newlines() == [1, 5, 6]
+
+
+def test_gap_buffer_appends_then_edits_inside_gap() -> None:
+    buf = GapBuffer()
+    for char in "ab\ncd\nef":
+        buf.insert(len(buf), char)
+    assert buf.text() == "ab\ncd\nef"
+    assert buf.newlines() == [2, 5]
+    assert (buf.line_start(4), buf.line_end(4)) == (3, 5)
+
+    buf.insert(4, "X\n")
+    assert buf.text() == "ab\ncX\nd\nef"
+    assert buf.newlines() == [2, 5, 7]
+    assert (buf.line_start(6), buf.line_end(6)) == (6, 7)
+
+    buf.delete(1, 4)
+    assert buf.text() == "aX\nd\nef"
+    assert buf.newlines() == [2, 4]
+    assert (buf.line_start(0), buf.line_end(0)) == (0, 2)
+    assert (buf.line_start(len(buf)), buf.line_end(len(buf))) == (5, 7)
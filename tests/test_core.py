@@ -1,7 +1,9 @@
+import functools
 from pathlib import Path
 
 import pytest
 
+from pymacs.buffer import GapBuffer
 from pymacs.commands import register_builtin_commands
 from pymacs.core import Editor
 
@@ -36,6 +38,56 @@ def test_runtime_command_metadata() -> None:
     assert any(command.name == "echo-value" for command in editor.command_infos())
 
 
+def test_editor_instance_accepts_plugin_attributes() -> None:
+    editor = Editor()
+    editor.plugin_data = {"count": 1}
+    editor.run = lambda name, *args: f"patched {name}"
+    assert editor.plugin_data == {"count": 1}
+    assert editor.run("anything") == "patched anything"
+
+
+def test_wrapped_commands_report_their_own_signatures() -> None:
+    def logged(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+    @logged
+    def one(ed: Editor, a: str) -> str:
+        return a
+
+    @logged
+    def three(ed: Editor, x: str, y: str, z: str) -> str:
+        return x + y + z
+
+    editor = Editor()
+    editor.command("one", one)
+    editor.command("three", three)
+    assert "x: str, y: str, z: str" in editor.get_command_info("three").signature
+    assert "a: str" in editor.get_command_info("one").signature
+    assert editor.run("three", "a", "b", "c") == "abc"
+
+
+def test_register_commands_bulk_registration() -> None:
+    editor = Editor()
+
+    def first(_ed: Editor) -> str:
+        """Return one."""
+        return "one"
+
+    editor.register_commands({"first": first, "second": lambda _ed: "two"}, source_kind="plugin")
+
+    assert editor.commands == ["first", "second"]
+    assert editor.command_names_line() == "first second"
+    editor.command("alpha", first)
+    assert editor.command_names_line() == "alpha first second"
+    assert editor.run("second") == "two"
+    assert editor.get_command_info("first").doc == "Return one."
+    assert editor.get_command_info("second").source_kind == "plugin"
+
+
 def test_emacs_style_cursor_editing_commands() -> None:
     editor = Editor()
     register_builtin_commands(editor)
@@ -53,6 +105,19 @@ def test_emacs_style_cursor_editing_commands() -> None:
     assert editor.run("show-buffer") == "bc"
 
 
+def test_char_motion_clamps_to_buffer_bounds() -> None:
+    editor = Editor()
+    register_builtin_commands(editor)
+
+    editor.run("insert", "abc")
+    editor.run("backward-char", "10")
+    assert editor.state.current_cursor() == 0
+    editor.run("forward-char", "2")
+    assert editor.state.current_cursor() == 2
+    editor.run("forward-char", "10")
+    assert editor.state.current_cursor() == 3
+
+
 def test_line_navigation_and_kill_line() -> None:
     editor = Editor()
     register_builtin_commands(editor)
@@ -94,6 +159,29 @@ def test_window_split_and_navigation() -> None:
     assert editor.window_list() == [windows[1]]
 
 
+def test_nested_split_delete_keeps_layout_consistent() -> None:
+    editor = Editor()
+    register_builtin_commands(editor)
+
+    editor.run("split-window-right")
+    editor.run("other-window")
+    editor.run("split-window-below")
+    assert editor.window_list() == [1, 2, 3]
+    assert editor.state.layout_tree() == (
+        "split",
+        "right",
+        ("window", 1),
+        ("split", "below", ("window", 2), ("window", 3)),
+    )
+
+    editor.run("delete-window")
+    assert editor.window_list() == [1, 3]
+    assert editor.state.layout_tree() == ("split", "right", ("window", 1), ("window", 3))
+
+    editor.run("split-window-below")
+    assert editor.window_list() == [1, 3, 4]
+
+
 def test_window_local_point_memory() -> None:
     editor = Editor()
     register_builtin_commands(editor)
@@ -137,6 +225,94 @@ def test_kill_buffer_falls_back_to_recent_buffer() -> None:
     assert editor.window_buffer(first_window) == "b"
 
 
+def test_list_buffers_tracks_created_and_killed_buffers() -> None:
+    editor = Editor()
+    register_builtin_commands(editor)
+
+    editor.run("switch-to-buffer", "notes")
+    editor.run("switch-to-buffer", "alpha")
+    editor.run("kill-buffer", "notes")
+    assert editor.state.buffer_names() == ["*scratch*", "alpha"]
+
+    editor.run("list-buffers")
+    listing = editor.state.buffer_text("*Buffer List*")
+    assert listing.splitlines()[4:] == [
+        "  *scratch*            0 chars",
+        "* alpha                0 chars",
+    ]
+
+
+def test_kill_buffer_added_directly_to_buffers() -> None:
+    editor = Editor()
+    register_builtin_commands(editor)
+
+    editor.run("switch-to-buffer", "notes")
+    editor.state.buffers["direct"] = GapBuffer()
+    editor.run("kill-buffer", "direct")
+    assert editor.state.buffer_names() == ["*scratch*", "notes"]
+
+    editor.state.buffers["zzz"] = GapBuffer()
+    assert editor.state.buffer_names() == ["*scratch*", "notes", "zzz"]
+    editor.run("kill-buffer", "notes")
+    assert editor.state.buffer_names() == ["*scratch*", "zzz"]
+
+
+def test_switch_buffer_after_direct_window_buffer_assignment() -> None:
+    editor = Editor()
+    register_builtin_commands(editor)
+
+    editor.run("split-window-below")
+    # Deleting builds the buffer -> windows index that switching maintains.
+    editor.run("insert", "abcdefg")
+    editor.run("delete-backward-char")
+
+    window = editor.state.windows[editor.selected_window_id]
+    window.buffer = "other"
+    editor.run("switch-to-buffer", "notes")
+    assert editor.window_buffer(window.id) == "notes"
+
+    editor.run("switch-to-buffer", "*scratch*")
+    editor.run("delete-backward-char")
+    assert editor.run("show-buffer") == "abcde"
+    assert editor.state.current_cursor() == 5
+
+
+def test_edits_clamp_points_of_windows_showing_other_buffers() -> None:
+    editor = Editor()
+    register_builtin_commands(editor)
+
+    editor.run("insert", "0123456789")
+    editor.run("split-window-below")
+    first, second = editor.window_list()
+    editor.run("switch-to-buffer", "notes")
+
+    editor.run("other-window")
+    assert editor.selected_window_id == second
+    for _ in range(8):
+        editor.run("delete-backward-char")
+    editor.run("insert", "abcdefgh")
+
+    editor.run("other-window")
+    editor.run("switch-to-buffer", "*scratch*")
+    assert editor.state.window_cursor(first) == 2
+
+
+def test_plain_str_buffers_are_accepted() -> None:
+    editor = Editor()
+    register_builtin_commands(editor)
+
+    editor.state.buffers["legacy"] = "hello"  # type: ignore[assignment]
+    editor.run("switch-to-buffer", "legacy")
+    editor.run("move-end-of-line")
+    editor.run("insert", "!")
+    assert editor.run("show-buffer") == "hello!"
+    assert str(editor.state.buffers["legacy"]) == "hello!"
+
+    editor.state.buffers["other"] = "abc"  # type: ignore[assignment]
+    editor.state.ensure_buffer("other")
+    assert isinstance(editor.state.buffers["other"], GapBuffer)
+
+
 def test_hook_failure_isolated(caplog: pytest.LogCaptureFixture) -> None:
     editor = Editor()
 
@@ -181,3 +357,17 @@ def test_load_plugin_requires_activate(tmp_path: Path) -> None:
     editor = Editor()
     with pytest.raises(TypeError, match="must define activate"):
         editor.load_plugin(str(plugin))
+
+
+def test_load_plugin_reload_picks_up_edits(tmp_path: Path) -> None:
+    plugin = tmp_path / "reload_plugin.py"
+    plugin.write_text("def activate(editor):\n    editor.command('ver', lambda ed: 1)\n", encoding="utf-8")
+
+    editor = Editor()
+    editor.load_plugin(str(plugin))
+    editor.load_plugin(str(plugin))
+    assert editor.run("ver") == 1
+
+    plugin.write_text("def activate(editor):\n    editor.command('ver', lambda ed: 22)\n", encoding="utf-8")
+    editor.load_plugin(str(plugin))
+    assert editor.run("ver") == 22
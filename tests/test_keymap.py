@@ -7,6 +7,7 @@ from pymacs.keymap import parse_key_sequence
 def test_parse_key_sequence_normalizes_tokens() -> None:
     assert parse_key_sequence("C-X M-S-f") == ("C-x", "M-S-f")
     assert parse_key_sequence(["ctrl-a", "ALT-b"]) == ("C-a", "M-b")
+    assert parse_key_sequence("shift-meta-C-M-q RET") == ("C-M-S-q", "ret")
 
 
 def test_parse_key_sequence_rejects_invalid_modifier() -> None:
@@ -40,6 +41,21 @@ def test_keymap_layering_mode_over_buffer_over_global() -> None:
     assert editor.command_execute("C-x") == "buffer"
 
 
+def test_resolved_bindings_expire_when_buffer_is_killed() -> None:
+    editor = Editor()
+    editor.command("global-cmd", lambda _ed: "global")
+    editor.command("buffer-cmd", lambda _ed: "buffer")
+
+    editor.bind_key("C-c", "global-cmd")
+    editor.state.set_selected_buffer("notes")
+    editor.bind_key("C-c", "buffer-cmd", scope="buffer")
+    assert editor.resolve_key("C-c") == "buffer-cmd"
+
+    editor.state.kill_buffer("notes")
+    editor.state.set_selected_buffer("notes")
+    assert editor.resolve_key("C-c") == "global-cmd"
+
+
 def test_mode_precedence_is_last_enabled_first() -> None:
     editor = Editor()
     editor.command("mode-a", lambda _ed: "A")
@@ -59,6 +75,25 @@ def test_unbound_key_sequence_raises() -> None:
         editor.command_execute("C-z")
 
 
+def test_lookup_key_returns_none_when_unbound() -> None:
+    editor = Editor()
+    editor.command("quit", lambda _ed: None)
+    editor.bind_key("C-x C-c", "quit")
+    assert editor.lookup_key("C-x C-c") == "quit"
+    assert editor.lookup_key("C-x") is None
+    assert editor.lookup_key("C-z") is None
+
+
+def test_direct_keymap_writes_apply_after_bump() -> None:
+    editor = Editor()
+    editor.command("quit", lambda _ed: None)
+    assert editor.lookup_key("C-z") is None
+
+    editor.state.global_keymap[("C-z",)] = "quit"
+    editor.state.bump_keymap_revision()
+    assert editor.lookup_key("C-z") == "quit"
+
+
 def test_has_prefix_binding() -> None:
     editor = Editor()
     editor.command("quit", lambda _ed: None)
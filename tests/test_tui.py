@@ -1,11 +1,14 @@
 import asyncio
+import io
 
 import pytest
+from rich.console import Console
 from rich.layout import Layout
 from rich.panel import Panel
+from textual.events import Paste
 from textual.widgets import Input, Static
 
-from pymacs.ui.app import PyMACSTuiApp
+from pymacs.ui.app import PyMACSTuiApp, _key_to_sequence, _visible_span
 
 
 def _selected_window(app: PyMACSTuiApp):
@@ -42,6 +45,21 @@ def _panel_contents(layout: Layout) -> list[tuple[str, str]]:
     return entries
 
 
+def test_key_to_sequence_canonicalizes_modifiers() -> None:
+    assert _key_to_sequence("ctrl+x") == "C-x"
+    assert _key_to_sequence("shift+ctrl+home") == "C-S-home"
+    assert _key_to_sequence("a") is None
+    assert _key_to_sequence("ctrl+shift") is None
+
+
+def test_visible_span_keeps_point_line_in_view() -> None:
+    text = "a\nb\nc\nd\ne"
+    assert _visible_span(text, 0, 0) == (0, len(text))
+    assert _visible_span(text, 0, 3) == (0, 5)
+    assert _visible_span(text, 8, 3) == (4, 9)
+    assert _visible_span(text, 4, 10) == (0, 9)
+
+
 def test_tui_renders_initial_workspace() -> None:
     async def scenario() -> None:
         app = PyMACSTuiApp()
@@ -55,6 +73,110 @@ def test_tui_renders_initial_workspace() -> None:
     asyncio.run(scenario())
 
 
+def test_tui_refresh_rerenders_only_changed_windows() -> None:
+    async def scenario() -> None:
+        app = PyMACSTuiApp()
+        async with app.run_test() as pilot:
+            await pilot.press("h", "i")
+            await pilot.pause()
+            workspace = app.query_one("#workspace", Static)
+            single_panel = workspace.renderable["window-1"].renderable
+
+            await pilot.press("ctrl+x", "3")
+            await pilot.pause()
+            layout = workspace.renderable
+            assert isinstance(layout, Layout)
+            selected_panel = layout["window-1"].renderable
+            assert selected_panel is single_panel
+            other_panel = layout["window-2"].renderable
+
+            await pilot.press("ctrl+b")
+            await pilot.pause()
+            assert workspace.renderable is layout
+            assert layout["window-1"].renderable is not selected_panel
+            assert layout["window-2"].renderable is other_panel
+            assert _selected_window(app).cursor == 1
+
+    asyncio.run(scenario())
+
+
+def test_tui_refresh_skips_unchanged_snapshot() -> None:
+    async def scenario() -> None:
+        app = PyMACSTuiApp()
+        async with app.run_test() as pilot:
+            await pilot.press("h")
+            await pilot.pause()
+            status = app.query_one("#status", Static)
+            rendered_status = status.renderable
+
+            app._refresh_view()
+            assert status.renderable is rendered_status
+
+            # Same status line, so only the workspace is repainted.
+            await pilot.press("i")
+            await pilot.pause()
+            assert _selected_window(app).text == "hi"
+            assert status.renderable is rendered_status
+
+            await pilot.press("ctrl+x", "2")
+            await pilot.pause()
+            assert "windows=2" in str(status.renderable)
+
+    asyncio.run(scenario())
+
+
+def test_tui_resize_recuts_visible_text() -> None:
+    async def scenario() -> None:
+        app = PyMACSTuiApp()
+        async with app.run_test(size=(80, 24)) as pilot:
+            app.controller.handle_text_input("\n".join(f"line {n}" for n in range(60)))
+            app._refresh_view()
+            await pilot.pause()
+            workspace = app.query_one("#workspace", Static)
+            [(_style, before)] = _panel_contents(workspace.renderable)
+
+            await pilot.resize_terminal(80, 40)
+            await pilot.pause()
+            [(_style, after)] = _panel_contents(workspace.renderable)
+            assert after.rstrip().endswith("line 59")
+            assert len(after.splitlines()) > len(before.splitlines())
+
+    asyncio.run(scenario())
+
+
+def test_tui_stacked_windows_keep_point_line_visible() -> None:
+    async def scenario() -> None:
+        app = PyMACSTuiApp()
+        async with app.run_test(size=(80, 24)) as pilot:
+            app.controller.handle_text_input("\n".join(f"line {n}" for n in range(60)))
+            await pilot.press("ctrl+x", "2")
+            await pilot.pause()
+
+            def rendered_panes() -> str:
+                workspace = app.query_one("#workspace", Static)
+                size = workspace.content_size
+                console = Console(width=size.width, height=size.height, file=io.StringIO())
+                with console.capture() as capture:
+                    console.print(workspace.renderable)
+                return capture.get()
+
+            # Both panes show the same buffer with point on its last line.
+            assert rendered_panes().count("line 59") == 2
+            unselected_before = [text for style, text in _panel_contents(
+                app.query_one("#workspace", Static).renderable
+            ) if style != "bright_green"]
+
+            await pilot.resize_terminal(80, 40)
+            await pilot.pause()
+            assert rendered_panes().count("line 59") == 2
+            unselected_after = [text for style, text in _panel_contents(
+                app.query_one("#workspace", Static).renderable
+            ) if style != "bright_green"]
+            assert len(unselected_after[0].splitlines()) > len(unselected_before[0].splitlines())
+
+    asyncio.run(scenario())
+
+
 def test_tui_typing_and_minibuffer_command() -> None:
     async def scenario() -> None:
         app = PyMACSTuiApp()
@@ -175,8 +297,7 @@ def test_tui_cursor_format_applies_to_selected_window_only() -> None:
     async def scenario() -> None:
         app = PyMACSTuiApp()
         async with app.run_test() as pilot:
-            await pilot.press("h", "i")
-            await pilot.press("ctrl+x", "2")
+            await pilot.press("h", "i", "ctrl+x", "2")
             await pilot.pause()
 
             app.controller.execute_minibuffer("run set cursor.format []")
@@ -231,9 +352,22 @@ def test_tui_backspace_routes_to_del_binding() -> None:
     async def scenario() -> None:
         app = PyMACSTuiApp()
         async with app.run_test() as pilot:
-            await pilot.press("h", "i")
-            await pilot.press("backspace")
+            await pilot.press("h", "i", "backspace")
             await pilot.pause()
             assert _selected_window(app).text == "h"
 
     asyncio.run(scenario())
+
+
+def test_tui_paste_inserts_text_in_single_command() -> None:
+    async def scenario() -> None:
+        app = PyMACSTuiApp()
+        ran: list[str] = []
+        app.editor.on("before-command", lambda _ed, name, _args: ran.append(name))
+        async with app.run_test() as pilot:
+            app.post_message(Paste("ab\r\ncd"))
+            await pilot.pause()
+            assert _selected_window(app).text == "ab\ncd"
+            assert ran == ["insert"]
+
+    asyncio.run(scenario())
@@ -1,3 +1,7 @@
+import dataclasses
+
+import pytest
+
 from pymacs.commands import register_builtin_commands
 from pymacs.core import Editor
 from pymacs.ui.controller import UIController
@@ -17,6 +21,39 @@ def _selected_window(controller: UIController):
     raise AssertionError("missing selected window")
 
 
+def test_snapshot_reuses_unchanged_window_and_layout_snapshots() -> None:
+    controller = _new_controller()
+    controller.handle_text_input("ab\ncd")
+    controller.execute_minibuffer("run split-window-right")
+
+    first = controller.snapshot()
+    second = controller.snapshot()
+    assert second.layout is first.layout
+    assert all(a is b for a, b in zip(first.windows, second.windows))
+
+    controller.execute_minibuffer("run backward-char")
+    third = controller.snapshot()
+    assert third.layout is first.layout
+    assert third.windows[0] is not first.windows[0]
+    assert (third.windows[0].line, third.windows[0].col) == (2, 2)
+    assert third.windows[1] is first.windows[1]
+
+
+def test_snapshot_windows_by_id_is_read_only_and_derived() -> None:
+    controller = _new_controller()
+    controller.execute_minibuffer("run split-window-right")
+
+    snapshot = controller.snapshot()
+    assert list(snapshot.windows_by_id.values()) == list(snapshot.windows)
+    with pytest.raises(TypeError):
+        snapshot.windows_by_id[0] = snapshot.windows[0]  # type: ignore[index]
+
+    fields = {f.name: getattr(snapshot, f.name) for f in dataclasses.fields(snapshot) if f.init}
+    rebuilt = type(snapshot)(**fields)
+    assert rebuilt == snapshot
+    assert dict(rebuilt.windows_by_id) == dict(snapshot.windows_by_id)
+
+
 def test_snapshot_and_text_mutations() -> None:
     controller = _new_controller()
 
@@ -126,6 +163,21 @@ def test_help_prefix_rejects_unknown_subcommand() -> None:
     assert not controller.has_pending_keys()
 
 
+def test_dispatch_follows_keymap_changes_after_lookup() -> None:
+    controller = _new_controller()
+    controller.handle_text_input("hi")
+
+    assert controller.dispatch_key_chord("C-c") == "unbound key sequence: C-c"
+    controller.editor.bind_key("C-c s", "show-buffer")
+    assert controller.dispatch_key_chord("C-c") == "pending C-c"
+    assert controller.dispatch_key_chord("s") == "hi"
+
+    controller.editor.run("switch-to-buffer", "notes")
+    controller.editor.bind_key("C-c s", "newline", scope="buffer")
+    assert controller.dispatch_key_chord("C-c s") == "executed C-c s"
+    assert controller.editor.state.buffer_text("notes") == "\n"
+
+
 def test_execute_minibuffer_happy_paths() -> None:
     controller = _new_controller()
 
@@ -141,7 +193,7 @@ def test_execute_minibuffer_happy_paths() -> None:
     assert controller.execute_minibuffer("mode insert off") == "mode insert: off"
     assert controller.execute_minibuffer("buf") == "notes"
     assert "show-buffer" in controller.execute_minibuffer("commands")
-    assert controller.execute_minibuffer("help").startswith("commands:")
+    assert controller.execute_minibuffer("help") == "commands: run bind press mode modes buf commands help"
 
 
 def test_execute_minibuffer_error_paths() -> None:
@@ -154,3 +206,35 @@ def test_execute_minibuffer_error_paths() -> None:
     assert controller.execute_minibuffer("mode") == "usage: mode <name> [on|off]"
     assert controller.execute_minibuffer("unknown") == "unknown command: unknown"
     assert controller.execute_minibuffer('run "unterminated').startswith("parse error:")
+    # Cached parse failures still report the error on repeat submissions.
+    assert controller.execute_minibuffer('run "unterminated').startswith("parse error:")
+
+
+def test_execute_minibuffer_quoted_arguments() -> None:
+    controller = _new_controller()
+
+    assert controller.execute_minibuffer('run insert "a  b"') == "ran insert"
+    assert controller.execute_minibuffer("run insert 'c'") == "ran insert"
+    assert controller.execute_minibuffer("run show-buffer") == "a  bc"
+
+
+def test_execute_minibuffer_unquoted_splits_like_shlex() -> None:
+    controller = _new_controller()
+
+    # Only ASCII space, tab, CR and LF separate words, quoted or not.
+    assert controller.execute_minibuffer("run insert a b\x0bc") == "ran insert"
+    assert controller.execute_minibuffer("run\tshow-buffer") == "a b\x0bc"
+
+
+def test_controller_methods_can_be_patched_on_the_instance() -> None:
+    controller = _new_controller()
+    seen: list[str] = []
+    original = controller.dispatch_key_chord
+
+    def spy(chord: str) -> str:
+        seen.append(chord)
+        return original(chord)
+
+    controller.dispatch_key_chord = spy
+    assert controller.execute_minibuffer("press C-x") == "pending C-x"
+    assert seen == ["C-x"]